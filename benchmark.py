@@ -0,0 +1,231 @@
+"""
+Benchmark suite for the six exercise engines, with regression tracking.
+
+Each engine is timed over a ladder of input sizes (best of several runs,
+after one warm-up run). Results can be saved as a JSON baseline and later
+runs compared against it; any case slower than the baseline by more than
+the threshold is reported as a regression and the exit status is 1.
+
+Usage (from the repository root):
+    python benchmark.py --save baseline.json
+    python benchmark.py --compare baseline.json --threshold 0.10
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+from primality import sieve_of_eratosthenes
+from primality.backend import BACKEND
+from primality.core import is_prime  # the test itself, not the result cache
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10  # 10% slower than the baseline is a regression
+
+
+def load_exercise(number):
+    """
+    Import ex-<number>.py, whose name is not a valid module name.
+    
+    Args:
+        number (int): Exercise number
+    
+    Returns:
+        module: The loaded exercise module
+    """
+    path = os.path.join(ROOT, f"ex-{number}.py")
+    spec = importlib.util.spec_from_file_location(f"ex_{number}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _is_prime_range(start, count=10000):
+    """
+    Test count consecutive odd numbers from start with is_prime.
+    
+    Args:
+        start (int): First number (made odd)
+        count (int): Number of values tested
+    
+    Returns:
+        int: Number of primes found
+    """
+    start |= 1
+    return sum(1 for n in range(start, start + 2 * count, 2) if is_prime(n))
+
+
+def _quietly(function, *args, **kwargs):
+    """
+    Call function with its printed progress discarded.
+    
+    Args:
+        function (callable): Function to call
+    
+    Returns:
+        Whatever function returns
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def benchmark_cases(quick=False):
+    """
+    Build the list of benchmark cases.
+    
+    Args:
+        quick (bool): If True, drop the largest size of every ladder
+    
+    Returns:
+        list: List of tuples (name, callable), where name is
+        "engine[size]" and callable runs the case once
+    """
+    ex3, ex4, ex5, ex6 = (load_exercise(number) for number in (3, 4, 5, 6))
+    
+    ladders = [
+        ("is_prime", [(f"10^{k}", lambda k=k: _is_prime_range(10**k)) for k in (6, 12, 18, 30)]),
+        ("sieve_of_eratosthenes", [(f"10^{k}", lambda k=k: sieve_of_eratosthenes(10**k)) for k in (5, 6, 7)]),
+        ("check_mersenne_primes", [(str(p), lambda p=p: ex3.check_mersenne_primes(p)) for p in (100, 500, 1000)]),
+        ("test_euler_polynomial", [(str(n), lambda n=n: ex4.test_euler_polynomial(0, n)) for n in (1000, 10000, 30000)]),
+        ("find_large_primes", [
+            # Digits of a number with the given bit length: ceil(bits * log10(2))
+            (f"{bits}bit", lambda bits=bits: _quietly(ex5.find_large_primes, -(-bits * 30103 // 100000), 3, seed=0))
+            for bits in (256, 512, 1024)
+        ]),
+        ("find_pseudoprimes_base2", [(f"10^{k}", lambda k=k: ex6.find_pseudoprimes_base2(10**k)) for k in (5, 6, 7)]),
+    ]
+    
+    cases = []
+    for engine, ladder in ladders:
+        if quick:
+            ladder = ladder[:-1]
+        cases.extend((f"{engine}[{size}]", run) for size, run in ladder)
+    return cases
+
+
+def run_benchmarks(cases, repeat=DEFAULT_REPEAT):
+    """
+    Time every case, printing one line per case as it finishes.
+    
+    Args:
+        cases (list): Cases from benchmark_cases
+        repeat (int): Timed runs per case (the fastest is kept)
+    
+    Returns:
+        dict: {case name: best time in seconds}
+    """
+    results = {}
+    
+    for name, run in cases:
+        run()  # warm-up: shared tables, imports, pool start-up
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        results[name] = best
+        print(f"{name:<40} {best * 1000:12.2f} ms")
+    
+    return results
+
+
+def save_baseline(results, path):
+    """
+    Write benchmark results and the environment they were measured in.
+    
+    Args:
+        results (dict): Output of run_benchmarks
+        path (str): Destination JSON file
+    """
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "backend": BACKEND,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def compare_results(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare benchmark results with a baseline.
+    
+    Args:
+        results (dict): Output of run_benchmarks
+        baseline (dict): Contents of a file written by save_baseline
+        threshold (float): Allowed relative slowdown (0.10 for 10%)
+    
+    Returns:
+        list: List of tuples (name, baseline_seconds, seconds, ratio) for
+        every case slower than the baseline by more than threshold
+    """
+    regressions = []
+    
+    for name, seconds in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = seconds / before
+        if ratio > 1 + threshold:
+            regressions.append((name, before, seconds, ratio))
+    
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmark suite; save or compare a baseline if requested."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown reported as a regression (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="timed runs per case (default: %(default)s)")
+    parser.add_argument("--quick", action="store_true", help="skip the largest size of every ladder")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    args = parser.parse_args(argv)
+    
+    print(f"Benchmarks (Python {platform.python_version()}, backend: {BACKEND})")
+    print("=" * 54)
+    
+    cases = [case for case in benchmark_cases(args.quick) if args.filter in case[0]]
+    results = run_benchmarks(cases, args.repeat)
+    
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"\nBaseline written to {args.save}")
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        
+        print(f"\nComparison with {args.compare} (threshold {args.threshold:.0%}):")
+        print("=" * 54)
+        for name, seconds in results.items():
+            before = baseline["results"].get(name)
+            if before is None:
+                print(f"{name:<40} {'new':>12}")
+            else:
+                print(f"{name:<40} {seconds / before:11.2f}x")
+        
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):")
+            for name, before, seconds, ratio in regressions:
+                print(f"  {name}: {before * 1000:.2f} ms -> {seconds * 1000:.2f} ms ({ratio:.2f}x)")
+            return 1
+        print("\nNo regressions.")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
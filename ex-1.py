@@ -5,28 +5,7 @@ A prime number is a natural number greater than 1 that has no positive divisors
 other than 1 and itself.
 """
 
-def is_prime(n):
-    """
-    Determines if a positive integer is prime.
-    
-    Args:
-        n (int): A positive integer to check for primality
-        
-    Returns:
-        bool: True if n is prime, False otherwise
-    """
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+from primality import is_prime
 
 
 def main():
@@ -4,75 +4,45 @@ Exercise 2: Write a function that lists all prime numbers less than or equal to
 This uses the Sieve of Eratosthenes algorithm for efficient prime generation.
 """
 
-def is_prime(n):
-    """
-    Determines if a positive integer is prime.
-    
-    Args:
-        n (int): A positive integer to check for primality
-        
-    Returns:
-        bool: True if n is prime, False otherwise
-    """
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+import os
+import sys
+import tempfile
 
-
-def sieve_of_eratosthenes(n):
-    """
-    Generate all prime numbers less than or equal to n using Sieve of Eratosthenes.
-    
-    Args:
-        n (int): Upper bound for prime generation
-        
-    Returns:
-        list: List of all prime numbers <= n
-    """
-    if n < 2:
-        return []
-    
-    # Create a boolean array "prime[0..n]" and set all entries as true
-    prime = [True] * (n + 1)
-    prime[0] = prime[1] = False
-    
-    p = 2
-    while p * p <= n:
-        # If prime[p] is not changed, then it is a prime
-        if prime[p]:
-            # Update all multiples of p
-            for i in range(p * p, n + 1, p):
-                prime[i] = False
-        p += 1
-    
-    # Collect all prime numbers
-    return [i for i in range(2, n + 1) if prime[i]]
+from primality import (
+    build_prime_store,
+    count_primes,
+    is_prime,
+    iter_primes,
+    load_prime_store,
+    next_prime,
+    nth_prime,
+    prime_count,
+    primes_between,
+    primes_up_to,
+    segmented_sieve,
+    sieve_of_eratosthenes,
+    write_results,
+)
 
 
-def list_primes_up_to(n):
+def list_primes_up_to(n, stream=False):
     """
     Lists all prime numbers less than or equal to n.
     
     Args:
         n (int): Upper bound for prime listing
+        stream (bool): If True, return a lazy iterator instead of a list
         
     Returns:
-        list: List of all prime numbers <= n
+        list: List of all prime numbers <= n (an iterator if stream is True)
     """
-    return sieve_of_eratosthenes(n)
+    if stream:
+        return segmented_sieve(n)
+    return primes_up_to(n)
 
 
-def main():
-    """Test the prime listing functions."""
+def main(output=None):
+    """Test the prime listing functions; optionally stream all primes <= 10^7 to a CSV/JSONL/Parquet file."""
     test_values = [10, 20, 50, 100]
     
     print("Testing prime listing functions:")
@@ -92,7 +62,35 @@ def main():
     print(f"Sieve method: {primes_sieve}")
     print(f"Simple method: {primes_simple}")
     print(f"Results match: {primes_sieve == primes_simple}")
+    
+    # Stream primes from a window far away from 2
+    lo, hi = 10**12, 10**12 + 1000
+    window = list(primes_between(lo, hi))
+    print(f"\nPrimes in [{lo}, {hi}): {len(window)}")
+    print(f"First five: {window[:5]}")
+    
+    primes_iter = iter_primes(start=10**9)
+    print(f"First three primes >= 10^9: {[next(primes_iter) for _ in range(3)]}")
+    
+    # Count primes far beyond anything that could be listed
+    print(f"\nπ(10^8) = {count_primes(10**8)} (Lucy_Hedgehog, O(n^(3/4)) time)")
+    
+    # Build a prime store once; later runs (and other processes) just map it
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "primes.bin")
+        build_prime_store(path, 10**6)
+        store = load_prime_store(path)
+        
+        print(f"\nPrime store up to 10^6 ({os.path.getsize(path) / 2**10:.1f} KiB):")
+        print(f"π(10^6) = {prime_count(10**6, store)}")
+        print(f"10,000th prime = {nth_prime(10**4, store)}")
+        print(f"Next prime after 10^6 - 100 = {next_prime(10**6 - 100, store)}")
+        del store  # release the mapping before the file is removed
+    
+    if output is not None:
+        count = write_results(list_primes_up_to(10**7, stream=True), output, fields=("prime",))
+        print(f"\nWrote {count} primes <= 10^7 to {output}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(*sys.argv[1:2])
\ No newline at end of file
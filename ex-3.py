@@ -5,79 +5,62 @@ for each prime number p not exceeding 100.
 These are called Mersenne primes - primes of the form 2^p - 1 where p is also prime.
 """
 
-def is_prime(n):
-    """
-    Determines if a positive integer is prime.
-    
-    Args:
-        n (int): A positive integer to check for primality
-        
-    Returns:
-        bool: True if n is prime, False otherwise
-    """
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
-
+import sys
 
-def sieve_of_eratosthenes(n):
-    """
-    Generate all prime numbers less than or equal to n using Sieve of Eratosthenes.
-    
-    Args:
-        n (int): Upper bound for prime generation
-        
-    Returns:
-        list: List of all prime numbers <= n
-    """
-    if n < 2:
-        return []
-    
-    prime = [True] * (n + 1)
-    prime[0] = prime[1] = False
-    
-    p = 2
-    while p * p <= n:
-        if prime[p]:
-            for i in range(p * p, n + 1, p):
-                prime[i] = False
-        p += 1
-    
-    return [i for i in range(2, n + 1) if prime[i]]
+from primality import (
+    checkpoint_writer,
+    load_checkpoint,
+    mersenne_table,
+    parallel_range_map,
+    primes_between,
+    write_results,
+)
 
 
-def check_mersenne_primes(max_p):
+def check_mersenne_primes(max_p, max_workers=1, checkpoint=None, resume=False):
     """
     Check if 2^p - 1 is prime for each prime p <= max_p.
     
+    With more than one worker the exponents are split into chunks that
+    shrink towards max_p, where each test is most expensive, and spread over
+    a process pool. If checkpoint is given, the last completed exponent and
+    the Mersenne prime exponents found so far are saved there every few
+    seconds.
+    
     Args:
         max_p (int): Maximum value of p to check
+        max_workers (int): Number of worker processes (None for all cores)
+        checkpoint (str): Path of the progress file, or None
+        resume (bool): If True, continue from the checkpoint when it exists
         
     Returns:
         list: List of tuples (p, mersenne_number, is_prime)
     """
-    primes = sieve_of_eratosthenes(max_p)
-    results = []
-    
-    for p in primes:
-        mersenne_number = (2 ** p) - 1
-        is_mersenne_prime = is_prime(mersenne_number)
-        results.append((p, mersenne_number, is_mersenne_prime))
+    scan = {"kind": "mersenne", "max_p": max_p}
+    start, results, exponents = 2, [], []
+    
+    state = load_checkpoint(checkpoint, scan) if resume and checkpoint is not None else None
+    if state is not None:
+        start, exponents = state["next"], state["exponents"]
+        found = set(exponents)
+        results = [(p, (1 << p) - 1, p in found) for p in primes_between(2, start)]
+    
+    save = checkpoint_writer(checkpoint, scan)
+    progress = {"next": start, "exponents": exponents}
+    try:
+        for _, hi, rows in parallel_range_map(mersenne_table, start, max_p + 1, max_workers, min_chunk=16):
+            results.extend(rows)
+            exponents.extend(p for p, _, is_prime_result in rows if is_prime_result)
+            progress["next"] = hi
+            save(progress)
+    finally:
+        save(progress, force=True)
     
     return results
 
 
-def main():
-    """Test Mersenne primes for p <= 100."""
+def main(output=None):
+    """Test Mersenne primes for p <= 100; optionally write the results to a CSV/JSONL/Parquet file."""
     print("Checking Mersenne primes: 2^p - 1 for prime p <= 100")
     print("=" * 60)
     
@@ -110,13 +93,17 @@ def main():
     print(f"\nTotal Mersenne primes found: {len(mersenne_primes)}")
     
     # Show the known Mersenne prime exponents for verification
-    known_mersenne_exponents = [2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 97]  # up to 100
+    known_mersenne_exponents = [2, 3, 5, 7, 13, 17, 19, 31, 61, 89]  # up to 100
     found_exponents = [p for p, _ in mersenne_primes]
     
     print(f"\nKnown Mersenne prime exponents <= 100: {known_mersenne_exponents}")
     print(f"Found Mersenne prime exponents <= 100: {found_exponents}")
     print(f"Results match: {set(known_mersenne_exponents) == set(found_exponents)}")
+    
+    if output is not None:
+        count = write_results(results, output, fields=("p", "mersenne_number", "is_prime"))
+        print(f"\nWrote {count} results to {output}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(*sys.argv[1:2])
\ No newline at end of file
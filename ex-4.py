@@ -5,28 +5,20 @@ with 0 ≤ n ≤ 39. But also show that it is not prime when n = 40.
 This is testing Euler's prime-generating polynomial.
 """
 
-def is_prime(n):
-    """
-    Determines if a positive integer is prime.
-    
-    Args:
-        n (int): A positive integer to check for primality
-        
-    Returns:
-        bool: True if n is prime, False otherwise
-    """
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+import sys
+from functools import partial
+
+from primality import (
+    explore_polynomial,
+    parallel_range_map,
+    polynomial_prime_flags,
+    polynomial_table,
+    search_polynomials,
+    write_results,
+)
+
+EULER_COEFFICIENTS = (1, 1, 41)  # n² + n + 41, highest degree first
+EULER_MIN_CHUNK = 256  # first chunk of test_euler_polynomial
 
 
 def euler_polynomial(n):
@@ -42,44 +34,69 @@ def euler_polynomial(n):
     return n * n + n + 41
 
 
-def test_euler_polynomial(start_n, end_n):
+def _is_composite_row(row):
+    """
+    Tell whether a test_euler_polynomial row holds a composite value.
+    
+    Args:
+        row (tuple): (n, polynomial_value, is_prime, factors)
+    
+    Returns:
+        bool: True if the value is not prime
+    """
+    return not row[2]
+
+
+def test_euler_polynomial(start_n, end_n, max_workers=1, stop_at_composite=False):
     """
     Test Euler's polynomial for primality over a range of n values.
     
+    The range is split into chunks that are tested in order, or spread over
+    a process pool when max_workers is not 1.
+    
     Args:
         start_n (int): Starting value of n
         end_n (int): Ending value of n (inclusive)
+        max_workers (int): Number of worker processes (None for all cores)
+        stop_at_composite (bool): If True, stop at the first composite value
+            (it is the last row returned) and cancel the remaining chunks
         
     Returns:
         list: List of tuples (n, polynomial_value, is_prime, factors_if_composite)
     """
     results = []
+    cancel_on = _is_composite_row if stop_at_composite else None
     
-    for n in range(start_n, end_n + 1):
-        value = euler_polynomial(n)
-        is_prime_result = is_prime(value)
-        
-        factors = None
-        if not is_prime_result and value > 1:
-            # Find factors for composite numbers
-            factors = []
-            temp = value
-            d = 2
-            while d * d <= temp:
-                while temp % d == 0:
-                    factors.append(d)
-                    temp //= d
-                d += 1
-            if temp > 1:
-                factors.append(temp)
-        
-        results.append((n, value, is_prime_result, factors))
+    # Primality comes from sieving the polynomial's roots modulo small primes
+    for _, _, rows in parallel_range_map(partial(polynomial_table, EULER_COEFFICIENTS),
+                                         start_n, end_n + 1, max_workers,
+                                         min_chunk=EULER_MIN_CHUNK, cancel_on=cancel_on):
+        results.extend(rows)
     
     return results
 
 
-def main():
-    """Test Euler's polynomial n² + n + 41."""
+def iter_euler_primality(start_n, end_n):
+    """
+    Stream (n, polynomial_value, is_prime) for start_n <= n <= end_n.
+    
+    Unlike test_euler_polynomial, nothing is factored or collected, so the
+    range can be far larger than memory.
+    
+    Args:
+        start_n (int): Starting value of n
+        end_n (int): Ending value of n (inclusive)
+        
+    Yields:
+        tuple: (n, polynomial_value, is_prime)
+    """
+    for low, flags in polynomial_prime_flags(EULER_COEFFICIENTS, start_n, end_n + 1):
+        for n, is_prime_result in zip(range(low, low + len(flags)), flags):
+            yield n, euler_polynomial(n), bool(is_prime_result)
+
+
+def main(output=None):
+    """Test Euler's polynomial n² + n + 41; optionally stream n ≤ 10^6 to a CSV/JSONL/Parquet file."""
     print("Testing Euler's polynomial: f(n) = n² + n + 41")
     print("=" * 50)
     
@@ -144,7 +161,28 @@ def main():
     print(f"f(40) = 40² + 40 + 41 = 1600 + 40 + 41 = 1681")
     print(f"1681 = 41² = 41 × 41")
     print(f"This happens because 40² + 40 + 41 = 40(40 + 1) + 41 = 40 × 41 + 41 = 41(40 + 1) = 41 × 41")
+    
+    # Density over a much longer range
+    report = explore_polynomial(EULER_COEFFICIENTS, 0, 10**6)
+    print(f"\nPrime values for n ∈ [0, 10^6]: {report['primes']} ({report['density'] * 100:.1f}%)")
+    
+    # Compare with the other polynomials n² + n + A
+    print("\nLongest initial prime runs of n² + n + A for A ≤ 1000 (n ∈ [0, 999]):")
+    print("-" * 50)
+    
+    reports = search_polynomials([(1, 1, a) for a in range(1, 1001)], 0, 999)
+    reports.sort(key=lambda report: report["first_composite"], reverse=True)
+    
+    for report in reports[:6]:
+        a = report["coefficients"][-1]
+        print(f"A = {a:4d}: prime for n = 0 to {report['first_composite'] - 1:2d}, "
+              f"density {report['density'] * 100:.1f}%")
+    
+    if output is not None:
+        count = write_results(iter_euler_primality(0, 10**6), output,
+                              fields=("n", "polynomial_value", "is_prime"))
+        print(f"\nWrote {count} values to {output}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(*sys.argv[1:2])
\ No newline at end of file
@@ -5,127 +5,66 @@ This task requires generating large random numbers and testing them for primalit
 We'll use the Miller-Rabin primality test for efficiency with large numbers.
 """
 
-import random
+import sys
 import time
+from itertools import islice
 
-
-def miller_rabin_test(n, k=10):
-    """
-    Miller-Rabin primality test for large numbers.
-    
-    Args:
-        n (int): Number to test for primality
-        k (int): Number of rounds of testing (higher k = more accurate)
-        
-    Returns:
-        bool: True if n is probably prime, False if n is definitely composite
-    """
-    if n < 2:
-        return False
-    if n == 2 or n == 3:
-        return True
-    if n % 2 == 0:
-        return False
-    
-    # Write n-1 as d * 2^r
-    r = 0
-    d = n - 1
-    while d % 2 == 0:
-        r += 1
-        d //= 2
-    
-    # Witness loop
-    for _ in range(k):
-        a = random.randrange(2, n - 1)
-        x = pow(a, d, n)  # a^d mod n
-        
-        if x == 1 or x == n - 1:
-            continue
-        
-        for _ in range(r - 1):
-            x = pow(x, 2, n)
-            if x == n - 1:
-                break
-        else:
-            return False
-    
-    return True
+from primality import iter_random_primes, miller_rabin_test, stats, write_results
 
 
 def is_prime_large(n):
     """
     Test if a large number is prime using Miller-Rabin test.
     
+    The number of rounds is chosen from the bit length of n.
+    
     Args:
         n (int): Number to test
         
     Returns:
         bool: True if probably prime, False if composite
     """
-    return miller_rabin_test(n, k=20)  # 20 rounds for high confidence
-
-
-def generate_random_odd_number(digits):
-    """
-    Generate a random odd number with exactly the specified number of digits.
-    
-    Args:
-        digits (int): Number of digits in the generated number
-        
-    Returns:
-        int: Random odd number with specified digits
-    """
-    if digits <= 0:
-        raise ValueError("Number of digits must be positive")
-    
-    # Ensure the number has exactly 'digits' digits
-    min_val = 10**(digits - 1)
-    max_val = 10**digits - 1
-    
-    # Generate random number in range
-    num = random.randint(min_val, max_val)
-    
-    # Make it odd
-    if num % 2 == 0:
-        num += 1
-        # Ensure it still has the right number of digits
-        if num > max_val:
-            num = max_val if max_val % 2 == 1 else max_val - 1
-    
-    return num
+    return miller_rabin_test(n)
 
 
-def find_large_primes(digit_count, count=10):
+def find_large_primes(digit_count, count=10, seed=None, max_workers=1, checkpoint=None, resume=False):
     """
     Find prime numbers with exactly the specified number of digits.
     
+    Candidates come from windows around random odd bases that are sieved
+    against the first few thousand primes, so only the survivors are tested.
+    
     Args:
         digit_count (int): Number of digits in each prime
         count (int): Number of primes to find
+        seed (int): Seed for reproducible results (random if None)
+        max_workers (int): Number of worker processes (None for all cores)
+        checkpoint (str): Path of a progress file (seed, next window and
+            primes found so far), written every few seconds
+        resume (bool): If True, continue from the checkpoint when it exists
         
     Returns:
         list: List of prime numbers with specified digit count
     """
+    if digit_count <= 0:
+        raise ValueError("Number of digits must be positive")
+    
     primes = []
-    attempts = 0
-    max_attempts = count * 1000  # Reasonable limit
     
     print(f"Searching for {count} prime numbers with {digit_count} digits...")
     print("This may take a while for large numbers.")
     
     start_time = time.time()
     
-    while len(primes) < count and attempts < max_attempts:
-        attempts += 1
-        candidate = generate_random_odd_number(digit_count)
-        
-        if is_prime_large(candidate):
+    candidates = iter_random_primes(10**(digit_count - 1), 10**digit_count, seed, max_workers,
+                                    checkpoint=checkpoint, resume=resume)
+    try:
+        for candidate in islice(candidates, count):
             primes.append(candidate)
             elapsed = time.time() - start_time
             print(f"Found prime #{len(primes)}: {str(candidate)[:20]}...{str(candidate)[-20:]} ({elapsed:.1f}s)")
-    
-    if len(primes) < count:
-        print(f"Warning: Only found {len(primes)} primes after {attempts} attempts")
+    except ValueError as error:
+        print(f"Warning: Only found {len(primes)} primes ({error})")
     
     return primes
 
@@ -150,7 +89,8 @@ def verify_prime_properties(primes, expected_digits):
         digit_ok = actual_digits == expected_digits
         
         # Re-test primality with higher confidence
-        prime_ok = miller_rabin_test(prime, k=50)
+        with stats.phase("verification"):
+            prime_ok = miller_rabin_test(prime, k=50)
         
         status = "✓" if (digit_ok and prime_ok) else "✗"
         
@@ -162,19 +102,19 @@ def verify_prime_properties(primes, expected_digits):
     return all_valid
 
 
-def main():
-    """Find and verify 10 different 100-digit prime numbers."""
+def main(output=None):
+    """Find and verify 10 different 100-digit prime numbers; optionally write them to a CSV/JSONL/Parquet file."""
     print("Exercise 5: Finding 10 different prime numbers with 100 digits")
     print("=" * 60)
     
-    # Set random seed for reproducible results (optional)
-    # random.seed(42)
+    # Set a seed for reproducible results (optional)
+    seed = None
     
     target_digits = 100
     target_count = 10
     
     # Find the primes
-    large_primes = find_large_primes(target_digits, target_count)
+    large_primes = find_large_primes(target_digits, target_count, seed)
     
     if len(large_primes) == target_count:
         print(f"\nSuccessfully found {target_count} primes with {target_digits} digits!")
@@ -214,7 +154,15 @@ def main():
                 print(f"Prime {i}:")
                 print(f"{prime}")
                 print()
+    
+    if output is not None:
+        count = write_results(large_primes, output, fields=("prime",))
+        print(f"Wrote {count} primes to {output}")
+    
+    # Enabled with PRIMALITY_STATS=1 (or PRIMALITY_PROGRESS=<seconds>)
+    if stats.ENABLED:
+        print(f"\nInstrumentation: {stats.format_stats()}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(*sys.argv[1:2])
\ No newline at end of file
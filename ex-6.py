@@ -6,33 +6,26 @@ A pseudoprime to base 2 is a composite number n that satisfies Fermat's Little T
 for base 2, even though it's not prime.
 """
 
-def is_prime(n):
-    """
-    Determines if a positive integer is prime.
-    
-    Args:
-        n (int): A positive integer to check for primality
-        
-    Returns:
-        bool: True if n is prime, False otherwise
-    """
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+import sys
+
+from primality import (
+    build_spf_table,
+    classify_pseudoprimes_between,
+    find_fermat_pseudoprimes,
+    is_prime,
+    spf_factorize,
+    stats,
+    window_pow,
+    write_results,
+)
 
 
 def fast_modular_exponentiation(base, exponent, modulus):
     """
-    Compute (base^exponent) mod modulus efficiently using binary exponentiation.
+    Compute (base^exponent) mod modulus efficiently with the built-in pow.
+    
+    window_pow hands the call to pow (or gmpy2 when it is installed),
+    whose sliding window in C beats any ladder written in Python.
     
     Args:
         base (int): Base number
@@ -42,19 +35,7 @@ def fast_modular_exponentiation(base, exponent, modulus):
     Returns:
         int: Result of (base^exponent) mod modulus
     """
-    result = 1
-    base = base % modulus
-    
-    while exponent > 0:
-        # If exponent is odd, multiply base with result
-        if exponent % 2 == 1:
-            result = (result * base) % modulus
-        
-        # exponent must be even now
-        exponent = exponent >> 1  # exponent = exponent / 2
-        base = (base * base) % modulus
-    
-    return result
+    return window_pow(base, exponent, modulus)
 
 
 def is_pseudoprime_base2(n):
@@ -83,53 +64,29 @@ def is_pseudoprime_base2(n):
     return fast_modular_exponentiation(2, n - 1, n) == 1
 
 
-def find_pseudoprimes_base2(max_n):
+def find_pseudoprimes_base2(max_n, max_workers=1, checkpoint=None, resume=False):
     """
     Find all pseudoprimes to base 2 up to max_n.
     
+    Primes are skipped with a segmented sieve and the remaining odd
+    composites are checked with the built-in three-argument pow. Large
+    bounds can be split over a process pool and resumed from a checkpoint.
+    
     Args:
         max_n (int): Maximum value to check
+        max_workers (int): Number of worker processes (None for all cores)
+        checkpoint (str): Path of a progress file, written every few seconds
+        resume (bool): If True, continue from the checkpoint when it exists
         
     Returns:
         list: List of all pseudoprimes to base 2 ≤ max_n
     """
-    pseudoprimes = []
-    
-    # Start from 9 (smallest odd composite > 2)
-    for n in range(9, max_n + 1, 2):  # Check only odd numbers
-        if is_pseudoprime_base2(n):
-            pseudoprimes.append(n)
-    
-    return pseudoprimes
+    # Even composites can't be pseudoprimes to base 2, so odd n suffice
+    return find_fermat_pseudoprimes(max_n, 2, max_workers, checkpoint=checkpoint, resume=resume)
 
 
-def factorize(n):
-    """
-    Find prime factorization of n.
-    
-    Args:
-        n (int): Number to factorize
-        
-    Returns:
-        list: List of prime factors
-    """
-    factors = []
-    d = 2
-    
-    while d * d <= n:
-        while n % d == 0:
-            factors.append(d)
-            n //= d
-        d += 1
-    
-    if n > 1:
-        factors.append(n)
-    
-    return factors
-
-
-def main():
-    """Find all pseudoprimes to base 2 up to 10000."""
+def main(output=None):
+    """Find all pseudoprimes to base 2 up to 10000; optionally write the classification to a CSV/JSONL/Parquet file."""
     print("Exercise 6: Finding pseudoprimes to base 2")
     print("=" * 50)
     print("Looking for composite numbers n where 2^(n-1) ≡ 1 (mod n)")
@@ -141,12 +98,15 @@ def main():
     print(f"Searching for pseudoprimes up to {max_value}...")
     pseudoprimes = find_pseudoprimes_base2(max_value)
     
+    # Every n below is factored from one smallest-prime-factor table
+    spf_table = build_spf_table(max_value)
+    
     print(f"\nFound {len(pseudoprimes)} pseudoprimes to base 2:")
     print("=" * 50)
     
     # Display results with factorizations
     for i, n in enumerate(pseudoprimes, 1):
-        factors = factorize(n)
+        factors = spf_factorize(n, spf_table)
         factor_str = ' × '.join(map(str, factors))
         
         # Verify the pseudoprime property
@@ -168,7 +128,7 @@ def main():
         factor_counts = {}
         
         for n in pseudoprimes:
-            factors = factorize(n)
+            factors = spf_factorize(n, spf_table)
             num_distinct = len(set(factors))
             
             if num_distinct not in factor_counts:
@@ -186,7 +146,7 @@ def main():
     examples = pseudoprimes[:3] if len(pseudoprimes) >= 3 else pseudoprimes
     
     for n in examples:
-        factors = factorize(n)
+        factors = spf_factorize(n, spf_table)
         power_mod = fast_modular_exponentiation(2, n - 1, n)
         
         print(f"\nn = {n} = {' × '.join(map(str, factors))}")
@@ -198,7 +158,31 @@ def main():
     # Historical note
     print(f"\nNote: The smallest pseudoprime to base 2 is 341 = 11 × 31.")
     print(f"Found 341 in our list: {341 in pseudoprimes}")
+    
+    # Classify the same range against several bases and definitions at once
+    bases = (2, 3, 5)
+    print(f"\nClassification for bases {bases} (n ≤ {max_value}):")
+    print("=" * 50)
+    
+    with stats.phase("classification"):
+        records = list(classify_pseudoprimes_between(3, max_value + 1, bases, spf_table))
+    
+    for kind in ("fermat", "strong", "euler_jacobi"):
+        for base in bases:
+            count = sum(1 for record in records if base in record[kind])
+            print(f"  {kind} pseudoprimes to base {base}: {count}")
+    
+    carmichael_numbers = [record["n"] for record in records if record["carmichael"]]
+    print(f"  Carmichael numbers: {carmichael_numbers}")
+    
+    if output is not None:
+        count = write_results(records, output)
+        print(f"\nWrote {count} classification records to {output}")
+    
+    # Enabled with PRIMALITY_STATS=1 (or PRIMALITY_PROGRESS=<seconds>)
+    if stats.ENABLED:
+        print(f"\nInstrumentation: {stats.format_stats()}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(*sys.argv[1:2])
\ No newline at end of file
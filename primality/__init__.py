@@ -0,0 +1,148 @@
+"""
+Shared prime-number algorithms used by the exercise scripts.
+
+The exercise files (ex-1.py ... ex-6.py) cannot be imported because of the
+hyphens in their names, so everything they have in common lives here.
+Importing the package does no sieve work; the shared prime table is only
+built the first time it is needed. agenerate_primes is loaded on first
+access, so only its users pay for importing asyncio and multiprocessing.
+"""
+
+from . import stats
+from .batch import is_prime_batch
+from .cache import (
+    cache_clear,
+    cache_info,
+    configure_cache,
+    factorize,
+    is_prime,
+    miller_rabin_test,
+    record_prime,
+)
+from .checkpoint import checkpoint_writer, load_checkpoint, write_checkpoint
+from .core import miller_rabin_rounds
+from .counting import count_primes
+from .factor import ecm, factorint, pollard_rho_brent
+from .generate import iter_random_primes, random_primes, window_parameters
+from .modexp import (
+    montgomery_context,
+    sliding_window_schedule,
+    window_pow,
+    window_pow_batch,
+)
+from .mersenne import is_mersenne_prime, lucas_lehmer, mersenne_table, mersenne_trial_factor
+from .parallel import parallel_range_map, range_chunks
+from .polynomial import (
+    explore_polynomial,
+    polynomial_prime_flags,
+    polynomial_primes_between,
+    polynomial_roots_mod,
+    polynomial_table,
+    polynomial_value,
+    search_polynomials,
+)
+from .pseudoprime import (
+    classify_pseudoprime,
+    classify_pseudoprimes_between,
+    fermat_pseudoprimes_between,
+    find_fermat_pseudoprimes,
+    multiplicative_order,
+)
+from .sieve import (
+    iter_primes,
+    prime_table,
+    primes_between,
+    primes_up_to,
+    segmented_sieve,
+    sieve_of_eratosthenes,
+    sieve_segment,
+    small_prime_flags,
+    wheel_segment,
+)
+from .sinks import SINK_WRITERS, write_results
+from .store import (
+    build_prime_store,
+    load_prime_store,
+    next_prime,
+    nth_prime,
+    prime_count,
+    store_primes_between,
+)
+from .spf import build_spf_table, load_spf_table, save_spf_table, spf_factorize
+from .wheel import WheelBitmap
+
+__all__ = [
+    "SINK_WRITERS",
+    "WheelBitmap",
+    "agenerate_primes",
+    "build_prime_store",
+    "build_spf_table",
+    "cache_clear",
+    "cache_info",
+    "checkpoint_writer",
+    "classify_pseudoprime",
+    "classify_pseudoprimes_between",
+    "configure_cache",
+    "count_primes",
+    "ecm",
+    "explore_polynomial",
+    "factorint",
+    "factorize",
+    "fermat_pseudoprimes_between",
+    "find_fermat_pseudoprimes",
+    "is_mersenne_prime",
+    "is_prime",
+    "is_prime_batch",
+    "iter_primes",
+    "iter_random_primes",
+    "load_checkpoint",
+    "load_prime_store",
+    "load_spf_table",
+    "lucas_lehmer",
+    "miller_rabin_rounds",
+    "miller_rabin_test",
+    "mersenne_table",
+    "mersenne_trial_factor",
+    "montgomery_context",
+    "multiplicative_order",
+    "next_prime",
+    "nth_prime",
+    "parallel_range_map",
+    "pollard_rho_brent",
+    "polynomial_prime_flags",
+    "polynomial_primes_between",
+    "polynomial_roots_mod",
+    "polynomial_table",
+    "polynomial_value",
+    "prime_count",
+    "prime_table",
+    "primes_between",
+    "primes_up_to",
+    "random_primes",
+    "range_chunks",
+    "record_prime",
+    "save_spf_table",
+    "search_polynomials",
+    "segmented_sieve",
+    "sieve_segment",
+    "sieve_of_eratosthenes",
+    "sliding_window_schedule",
+    "small_prime_flags",
+    "spf_factorize",
+    "store_primes_between",
+    "window_parameters",
+    "window_pow",
+    "wheel_segment",
+    "window_pow_batch",
+    "write_checkpoint",
+    "write_results",
+]
+
+
+def __getattr__(name):
+    """Import agenerate_primes from primality.aio on first access."""
+    if name == "agenerate_primes":
+        from .aio import agenerate_primes
+        
+        return agenerate_primes
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,134 @@
+"""
+asyncio interface to the random prime search.
+
+agenerate_primes runs the same sieved candidate windows as
+iter_random_primes on a pool of worker processes and hands each result
+back to the event loop, which is never blocked by the search itself. Only
+max_in_flight windows are queued at a time and new ones are submitted as
+the consumer asks for more primes, so a slow consumer holds the search
+back instead of letting results pile up. Leaving the loop, cancelling the
+consuming task or running out of time terminates the worker processes,
+including any window they are still testing.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import random
+from collections import deque
+
+from .cache import record_prime
+from .generate import MAX_IDLE_WINDOWS, _search_window
+
+
+def _resolve(future, result):
+    """
+    Set the result of a future unless it was cancelled in the meantime.
+    
+    Args:
+        future (asyncio.Future): Future to resolve
+        result: Window result
+    """
+    if not future.done():
+        future.set_result(result)
+
+
+def _reject(future, error):
+    """
+    Set the exception of a future unless it was cancelled in the meantime.
+    
+    Args:
+        future (asyncio.Future): Future to resolve
+        error (BaseException): Exception raised by the worker
+    """
+    if not future.done():
+        future.set_exception(error)
+
+
+def _submit(pool, loop, work):
+    """
+    Queue one window search and return an asyncio future for its result.
+    
+    The pool's result thread passes the outcome back to the event loop.
+    
+    Args:
+        pool (multiprocessing.pool.Pool): Worker pool
+        loop (asyncio.AbstractEventLoop): Loop owning the future
+        work (tuple): Arguments of _search_window
+    
+    Returns:
+        asyncio.Future: Resolves to the first prime of the window, or None
+    """
+    future = loop.create_future()
+    pool.apply_async(
+        _search_window, (work,),
+        callback=lambda result: loop.call_soon_threadsafe(_resolve, future, result),
+        error_callback=lambda error: loop.call_soon_threadsafe(_reject, future, error),
+    )
+    return future
+
+
+async def agenerate_primes(bits, count, seed=None, max_workers=None, max_in_flight=None,
+                           timeout=None, width=None):
+    """
+    Asynchronously yield distinct random primes with exactly bits bits.
+    
+    Use as "async for prime in agenerate_primes(1024, 10): ...". The primes
+    come in the same order as from iter_random_primes for the same seed, and
+    as there, ValueError is raised once MAX_IDLE_WINDOWS windows in a row
+    bring no new prime (bits=2 only holds the prime 3, for example). A
+    consumer that may stop early should wrap the generator in
+    contextlib.aclosing, so the workers are terminated as soon as it leaves
+    the loop rather than when the generator is garbage collected.
+    
+    Args:
+        bits (int): Bit length of every prime (at least 2)
+        count (int): Number of primes to yield
+        seed (int): Seed for the window bases (random if None)
+        max_workers (int): Number of worker processes (None for all cores)
+        max_in_flight (int): Largest number of queued windows (None for
+            twice the number of workers)
+        timeout (float): Seconds allowed for the whole request, or None;
+            when they run out asyncio.TimeoutError is raised
+        width (int): Number of odd candidates per window (None scales it
+            with bits)
+    
+    Yields:
+        int: Next prime, never repeating an earlier one
+    """
+    if bits < 2:
+        raise ValueError("bits must be at least 2")
+    if seed is None:
+        seed = random.randrange(1 << 64)
+    
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    workers = max_workers or os.cpu_count()
+    in_flight = max_in_flight or 2 * workers
+    lo, hi = 1 << (bits - 1), 1 << bits
+    seen = set()
+    index = idle = 0
+    
+    pool = multiprocessing.Pool(workers)
+    pending = deque()
+    try:
+        while len(seen) < count:
+            while len(pending) < in_flight:
+                pending.append(_submit(pool, loop, (lo, hi, seed, index, width)))
+                index += 1
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            prime = await asyncio.wait_for(pending.popleft(), remaining)
+            if prime is not None and prime not in seen:
+                seen.add(prime)
+                idle = 0
+                record_prime(prime)
+                yield prime
+            else:
+                idle += 1
+                if idle >= MAX_IDLE_WINDOWS:
+                    raise ValueError(f"no new prime in {idle} windows: "
+                                     f"{bits}-bit numbers hold too few odd primes")
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.terminate()
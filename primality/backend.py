@@ -0,0 +1,158 @@
+"""
+Big-integer backend for the modular arithmetic hot paths.
+
+When gmpy2 is installed, modular exponentiation, strong probable prime
+tests and Mersenne arithmetic run on GMP; otherwise the same functions fall
+back to CPython ints. Run this module (python -m primality.backend) to
+print the speedup per bit size.
+"""
+
+import random
+import time
+from math import gcd
+
+from . import stats
+
+try:
+    import gmpy2
+except ImportError:  # gmpy2 is optional
+    gmpy2 = None
+
+if gmpy2 is not None:
+    BACKEND = "gmpy2"
+    mpz = gmpy2.mpz
+    powmod = gmpy2.powmod
+else:
+    BACKEND = "python"
+    mpz = int
+    powmod = pow
+
+
+def _is_strong_prp_python(n, a):
+    """
+    Run one round of the strong (Miller-Rabin) test on odd n to base a.
+    
+    Args:
+        n (int): Odd number greater than a
+        a (int): Witness base
+    
+    Returns:
+        bool: False if a proves n composite, True otherwise
+    """
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def is_strong_prp(n, a):
+    """
+    Run one round of the strong (Miller-Rabin) test on odd n to base a.
+    
+    Args:
+        n (int): Odd number greater than a
+        a (int): Witness base
+    
+    Returns:
+        bool: False if a proves n composite, True otherwise
+    """
+    if stats.ENABLED:
+        stats.count("miller_rabin_rounds")
+        stats.count_modexp(n - 1, n)
+    if gmpy2 is None:
+        return _is_strong_prp_python(n, a)
+    # gmpy2 refuses a base sharing a factor with n; such an n is composite
+    return gcd(n, a) == 1 and gmpy2.is_strong_prp(n, a)
+
+
+def next_prime(n):
+    """
+    Find the smallest prime greater than n.
+    
+    GMP's next_prime is only probabilistic, so its answer is confirmed with
+    is_prime (Baillie-PSW) before it is returned.
+    
+    Args:
+        n (int): Starting point
+    
+    Returns:
+        int: Smallest prime p > n
+    """
+    from .core import is_prime
+    
+    if gmpy2 is not None:
+        p = int(gmpy2.next_prime(n))
+        while not is_prime(p):
+            p = int(gmpy2.next_prime(p))
+        return p
+    
+    p = max(n + 1, 2)
+    while not is_prime(p):
+        p += 1
+    return p
+
+
+def benchmark_powmod(bit_sizes=(512, 1024, 2048, 4096), repeat=20, seed=0):
+    """
+    Time modular exponentiation with CPython ints and with gmpy2.
+    
+    Args:
+        bit_sizes (tuple): Operand sizes in bits
+        repeat (int): Number of exponentiations timed per size
+        seed (int): Seed for the random operands
+    
+    Returns:
+        list: List of tuples (bits, python_seconds, gmpy2_seconds), where
+        gmpy2_seconds is None if gmpy2 is not installed
+    """
+    rng = random.Random(seed)
+    rows = []
+    
+    for bits in bit_sizes:
+        moduli = [rng.getrandbits(bits) | (1 << (bits - 1)) | 1 for _ in range(repeat)]
+        operands = [(rng.getrandbits(bits), rng.getrandbits(bits), m) for m in moduli]
+        
+        start = time.perf_counter()
+        for a, e, m in operands:
+            pow(a, e, m)
+        python_seconds = (time.perf_counter() - start) / repeat
+        
+        gmpy2_seconds = None
+        if gmpy2 is not None:
+            operands = [tuple(map(gmpy2.mpz, row)) for row in operands]
+            start = time.perf_counter()
+            for a, e, m in operands:
+                gmpy2.powmod(a, e, m)
+            gmpy2_seconds = (time.perf_counter() - start) / repeat
+        
+        rows.append((bits, python_seconds, gmpy2_seconds))
+    
+    return rows
+
+
+def main():
+    """Print the modular exponentiation speedup per bit size."""
+    print(f"Big-integer backend: {BACKEND}")
+    print("=" * 50)
+    print(f"{'bits':>6} {'python (ms)':>12} {'gmpy2 (ms)':>12} {'speedup':>8}")
+    
+    for bits, python_seconds, gmpy2_seconds in benchmark_powmod():
+        if gmpy2_seconds is None:
+            print(f"{bits:6d} {python_seconds * 1000:12.3f} {'-':>12} {'-':>8}")
+        else:
+            speedup = python_seconds / gmpy2_seconds
+            print(f"{bits:6d} {python_seconds * 1000:12.3f} {gmpy2_seconds * 1000:12.3f} {speedup:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
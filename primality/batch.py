@@ -0,0 +1,338 @@
+"""
+Batch primality testing over whole arrays of integers.
+
+NumPy is optional. When it is installed, uint64 arrays are tested chunk by
+chunk with vectorized sieve lookups, trial division and Miller-Rabin;
+otherwise the same API falls back to a pure-Python loop. Values of 2^32 and
+above are multiplied in Montgomery form: a 64x64-bit product is assembled
+from four 32-bit limb products, so nothing overflows a uint64.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from .core import is_prime
+from .sieve import SMALL_FLAGS_LIMIT, _is_small_prime, primes_up_to, small_prime_flags
+
+BATCH_CHUNK_SIZE = 1 << 18  # values tested per vectorized pass
+LOOKUP_LIMIT = SMALL_FLAGS_LIMIT  # values below this are answered from the shared bitmap
+
+VECTOR_TRIAL_LIMIT = 1 << 10  # odd primes below this are divided out in bulk
+TRIAL_GROUP_SIZE = 16  # trial primes applied between compactions
+
+# Deterministic Miller-Rabin bases for n < 2152302898747 (covers n < 2^32,
+# where every product of two residues fits in a uint64)
+VECTOR_WITNESSES = (2, 3, 5, 7, 11)
+# Deterministic Miller-Rabin bases for every n < 2^64 (Jim Sinclair's set)
+WIDE_VECTOR_WITNESSES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+_LOW_MASK = (1 << 32) - 1
+
+_trial = None
+
+
+def _trial_primes():
+    """
+    Return the odd primes below VECTOR_TRIAL_LIMIT as uint64 scalars.
+    
+    Returns:
+        list: Trial division primes
+    """
+    global _trial
+    
+    if _trial is None:
+        _trial = [np.uint64(p) for p in primes_up_to(VECTOR_TRIAL_LIMIT - 1)[1:]]
+    return _trial
+
+
+def _powmod_vector(a, d, n):
+    """
+    Compute a^d mod n elementwise for uint64 arrays with n < 2^32.
+    
+    Args:
+        a (int): Base shared by every element
+        d (numpy.ndarray): Exponents
+        n (numpy.ndarray): Moduli
+    
+    Returns:
+        numpy.ndarray: Array of a^d mod n
+    """
+    result = np.ones_like(n)
+    base = np.full_like(n, a) % n
+    exponent = d.copy()
+    
+    while exponent.any():
+        odd = (exponent & 1).astype(bool)
+        result = np.where(odd, result * base % n, result)
+        base = base * base % n
+        exponent >>= 1
+    return result
+
+
+def _strong_test_vector(n, a):
+    """
+    Run one strong (Miller-Rabin) round to base a on every element of n.
+    
+    Args:
+        n (numpy.ndarray): Odd uint64 values with a < n < 2^32
+        a (int): Witness base
+    
+    Returns:
+        numpy.ndarray: Boolean mask, False where a proves n composite
+    """
+    d = n - 1
+    s = np.zeros_like(n)
+    even = (d & 1) == 0
+    while even.any():
+        d = np.where(even, d >> 1, d)
+        s += even
+        even = (d & 1) == 0
+    
+    x = _powmod_vector(a, d, n)
+    passed = (x == 1) | (x == n - 1)
+    for i in range(1, int(s.max(initial=0))):
+        x = x * x % n
+        passed |= (x == n - 1) & (i < s)
+    return passed
+
+
+def _mul_high(a, b):
+    """
+    Compute the high 64 bits of a * b elementwise for uint64 arrays.
+    
+    Args:
+        a (numpy.ndarray): uint64 factors
+        b (numpy.ndarray): uint64 factors
+    
+    Returns:
+        numpy.ndarray: floor(a * b / 2^64)
+    """
+    a_lo, a_hi = a & _LOW_MASK, a >> 32
+    b_lo, b_hi = b & _LOW_MASK, b >> 32
+    cross_lo, cross_hi = a_lo * b_hi, a_hi * b_lo
+    middle = (a_lo * b_lo >> 32) + (cross_lo & _LOW_MASK) + (cross_hi & _LOW_MASK)
+    return a_hi * b_hi + (cross_lo >> 32) + (cross_hi >> 32) + (middle >> 32)
+
+
+def _montgomery_mul(a, b, n, n_inverse):
+    """
+    Montgomery product a * b / 2^64 mod n for uint64 arrays.
+    
+    Args:
+        a (numpy.ndarray): Residues below n
+        b (numpy.ndarray): Residues below n
+        n (numpy.ndarray): Odd moduli
+        n_inverse (numpy.ndarray): -n^-1 mod 2^64
+    
+    Returns:
+        numpy.ndarray: a * b * 2^-64 mod n
+    """
+    low = a * b  # wraps mod 2^64
+    m = low * n_inverse  # low + m * n is a multiple of 2^64
+    high = _mul_high(a, b)
+    t = high + _mul_high(m, n)
+    carry = t < high
+    total = t + (low != 0)  # the low halves sum to 2^64 unless both are 0
+    carry |= total < t
+    return np.where(carry | (total >= n), total - n, total)
+
+
+def _montgomery_constants(n):
+    """
+    Precompute -n^-1 mod 2^64, 2^64 mod n and 2^128 mod n for odd n.
+    
+    Args:
+        n (numpy.ndarray): Odd uint64 moduli
+    
+    Returns:
+        tuple: (n_inverse, one, r_squared) as uint64 arrays
+    """
+    inverse = n.copy()  # n * n == 1 (mod 8)
+    for _ in range(5):  # each Newton step doubles the correct low bits
+        inverse *= 2 - n * inverse
+    one = (0 - n) % n
+    
+    r_squared = one.copy()
+    for _ in range(64):  # double 2^64 mod n another 64 times
+        doubled = r_squared << 1
+        overflow = (r_squared >> 63) == 1
+        r_squared = np.where(overflow | (doubled >= n), doubled - n, doubled)
+    return 0 - inverse, one, r_squared
+
+
+def _strong_test_wide(n, a, d, s, constants):
+    """
+    Run one strong (Miller-Rabin) round to base a on uint64 values.
+    
+    Args:
+        n (numpy.ndarray): Odd values with a < n < 2^64
+        a (int): Witness base
+        d (numpy.ndarray): Odd parts of n - 1
+        s (numpy.ndarray): Exponents of 2 in n - 1
+        constants (tuple): Result of _montgomery_constants(n)
+    
+    Returns:
+        numpy.ndarray: Boolean mask, False where a proves n composite
+    """
+    n_inverse, one, r_squared = constants
+    minus_one = n - one
+    base = _montgomery_mul(np.full_like(n, a), r_squared, n, n_inverse)
+    
+    x = one.copy()
+    for bit in range(int(d.max(initial=0)).bit_length() - 1, -1, -1):
+        x = _montgomery_mul(x, x, n, n_inverse)
+        x = np.where((d >> bit) & 1 == 1, _montgomery_mul(x, base, n, n_inverse), x)
+    
+    passed = (x == one) | (x == minus_one)
+    for i in range(1, int(s.max(initial=0))):
+        x = _montgomery_mul(x, x, n, n_inverse)
+        passed |= (x == minus_one) & (i < s)
+    return passed
+
+
+def _is_prime_wide(n):
+    """
+    Decide primality of odd uint64 values in [2^32, 2^64) with no small factor.
+    
+    Witnesses are applied one after another, each only to the values that
+    passed every earlier one, so most composites cost a single round.
+    
+    Args:
+        n (numpy.ndarray): Odd uint64 values
+    
+    Returns:
+        numpy.ndarray: Boolean mask, True where the value is prime
+    """
+    d = n - 1
+    s = np.zeros_like(n)
+    even = (d & 1) == 0
+    while even.any():
+        d = np.where(even, d >> 1, d)
+        s += even
+        even = (d & 1) == 0
+    
+    mask = np.zeros(len(n), dtype=np.bool_)
+    index = np.arange(len(n))
+    constants = _montgomery_constants(n)
+    for a in WIDE_VECTOR_WITNESSES:
+        passed = _strong_test_wide(n, a, d, s, constants)
+        index, n, d, s = index[passed], n[passed], d[passed], s[passed]
+        constants = tuple(constant[passed] for constant in constants)
+    mask[index] = True
+    return mask
+
+
+def _is_prime_chunk(values):
+    """
+    Test one chunk of a uint64 array for primality.
+    
+    Args:
+        values (numpy.ndarray): uint64 values
+    
+    Returns:
+        numpy.ndarray: Boolean mask, True where the value is prime
+    """
+    flags = np.frombuffer(small_prime_flags(), dtype=np.bool_)  # odd numbers only
+    mask = np.zeros(len(values), dtype=np.bool_)
+    
+    small = values < LOOKUP_LIMIT
+    lookup = values[small]
+    mask[small] = flags[(lookup >> 1).astype(np.intp)] & (lookup & 1 == 1) | (lookup == 2)
+    
+    # Everything else is larger than every trial prime, so any hit is composite
+    index = np.flatnonzero(~small & (values & 1 == 1))
+    candidates = values[index]
+    primes = _trial_primes()
+    for start in range(0, len(primes), TRIAL_GROUP_SIZE):
+        survivors = np.ones(len(candidates), dtype=np.bool_)
+        for p in primes[start:start + TRIAL_GROUP_SIZE]:
+            survivors &= candidates % p != 0
+        index, candidates = index[survivors], candidates[survivors]
+    
+    narrow = candidates < (1 << 32)
+    passed = np.ones(int(narrow.sum()), dtype=np.bool_)
+    for a in VECTOR_WITNESSES:
+        passed &= _strong_test_vector(candidates[narrow], a)
+    mask[index[narrow]] = passed
+    
+    mask[index[~narrow]] = _is_prime_wide(candidates[~narrow])
+    return mask
+
+
+def _is_prime_batch_python(values):
+    """
+    Pure-Python fallback for is_prime_batch.
+    
+    Args:
+        values (iterable): Integers to test
+    
+    Returns:
+        list: List of booleans, True where the value is prime
+    """
+    return [
+        _is_small_prime(n) if n < LOOKUP_LIMIT else is_prime(n)
+        for n in map(int, values)
+    ]
+
+
+def _as_integer_array(values):
+    """
+    Convert an iterable of Python ints to the narrowest exact NumPy array.
+    
+    Args:
+        values (iterable): Integers to convert
+    
+    Returns:
+        numpy.ndarray: int64 or uint64 array, or an object array when some
+        value does not fit in 64 bits
+    """
+    if not hasattr(values, "__len__"):
+        values = list(values)
+    for dtype in (np.int64, np.uint64):
+        try:
+            return np.asarray(values, dtype=dtype)
+        except OverflowError:
+            pass
+    return np.asarray(values, dtype=object)
+
+
+def is_prime_batch(values, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Test many integers for primality in one call.
+    
+    With NumPy, integer arrays are converted to uint64 and processed
+    chunk_size elements at a time; values beyond 64 bits (or non-integer
+    arrays) are tested one by one with is_prime. Without NumPy the result
+    is a plain list.
+    
+    Args:
+        values (iterable): NumPy integer array or any iterable of ints
+        chunk_size (int): Number of elements handled per vectorized pass
+    
+    Returns:
+        numpy.ndarray: Boolean mask with the shape of values (a list of
+        booleans when NumPy is not installed)
+    """
+    if np is None:
+        return _is_prime_batch_python(values)
+    
+    if isinstance(values, np.ndarray):
+        array = values
+    else:
+        array = _as_integer_array(values)
+    
+    if array.dtype.kind not in "iu":
+        flat = array.ravel()
+        mask = np.fromiter(_is_prime_batch_python(flat), dtype=np.bool_, count=flat.size)
+        return mask.reshape(array.shape)
+    
+    if array.dtype.kind == "i":
+        array = np.where(array < 0, 0, array)  # negatives are never prime
+    flat = array.astype(np.uint64, copy=False).ravel()
+    
+    mask = np.empty(flat.size, dtype=np.bool_)
+    for start in range(0, flat.size, chunk_size):
+        mask[start:start + chunk_size] = _is_prime_chunk(flat[start:start + chunk_size])
+    return mask.reshape(array.shape)
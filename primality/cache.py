@@ -0,0 +1,254 @@
+"""
+Bounded result cache in front of is_prime, miller_rabin_test and factorize.
+
+The three functions exported by the package under those names look their
+argument up here before testing or factoring anything. Numbers below
+CACHE_SIEVE_LIMIT are answered from small_prime_flags, the sieve bitmap
+shared with the batch tests (and never factored through the cache, since
+trial division is already cheap there); larger results share one
+least-recently-used table, bounded by a number of entries, an estimated
+number of bytes, or both. The library's own hot loops
+call the uncached functions in core and factor directly, so the unique
+candidates of a search never evict the values a caller keeps asking about;
+the prime searches only record the primes they hand out, with record_prime.
+"""
+
+import sys
+from collections import OrderedDict
+
+from . import core, factor
+from .sieve import SMALL_FLAGS_LIMIT, _is_small_prime
+
+CACHE_SIEVE_LIMIT = SMALL_FLAGS_LIMIT  # n below this are answered from the bitmap
+CACHE_MAX_ENTRIES = 1 << 16  # default entry bound of the LRU table
+ENTRY_OVERHEAD = 100  # bytes of table bookkeeping counted per entry
+
+_entries = OrderedDict()  # (function name, n) -> result, oldest first
+_entry_bytes = 0
+_max_entries = CACHE_MAX_ENTRIES
+_max_bytes = None
+_counts = {"hits": 0, "misses": 0, "sieve_hits": 0}
+
+
+def _sieve_lookup(n):
+    """
+    Decide primality of a number below CACHE_SIEVE_LIMIT from the bitmap.
+    
+    Args:
+        n (int): Number below CACHE_SIEVE_LIMIT
+    
+    Returns:
+        bool: True if n is prime
+    """
+    _counts["sieve_hits"] += 1
+    return _is_small_prime(n)
+
+
+def _entry_size(key, value):
+    """
+    Estimate the memory held by one table entry.
+    
+    Args:
+        key (tuple): (function name, n)
+        value: Cached result (bool, int or tuple of factors)
+    
+    Returns:
+        int: Approximate size in bytes
+    """
+    size = ENTRY_OVERHEAD + sys.getsizeof(key) + sys.getsizeof(key[1]) + sys.getsizeof(value)
+    if isinstance(value, tuple):
+        size += sum(sys.getsizeof(p) for p in value)
+    return size
+
+
+def _lookup(key):
+    """
+    Return a cached result and mark it as recently used.
+    
+    Args:
+        key (tuple): (function name, n)
+    
+    Returns:
+        Cached result, or None if there is none
+    """
+    value = _entries.get(key)
+    if value is not None:
+        _entries.move_to_end(key)
+    return value
+
+
+def _evict():
+    """Drop the least recently used entries until the table is within its bounds."""
+    global _entry_bytes
+    
+    while _entries and (
+        (_max_entries is not None and len(_entries) > _max_entries)
+        or (_max_bytes is not None and _entry_bytes > _max_bytes)
+    ):
+        old_key, old_value = _entries.popitem(last=False)
+        _entry_bytes -= _entry_size(old_key, old_value)
+
+
+def _store(key, value):
+    """
+    Insert a result, then evict down to the table bounds.
+    
+    Args:
+        key (tuple): (function name, n)
+        value: Result to cache (not None)
+    """
+    global _entry_bytes
+    
+    old = _entries.pop(key, None)
+    if old is not None:
+        _entry_bytes -= _entry_size(key, old)
+    _entries[key] = value
+    _entry_bytes += _entry_size(key, value)
+    _evict()
+
+
+def is_prime(n):
+    """
+    Determines if a positive integer is prime, remembering the answer.
+    
+    See primality.core.is_prime for the test itself.
+    
+    Args:
+        n (int): A positive integer to check for primality
+    
+    Returns:
+        bool: True if n is prime, False otherwise
+    """
+    if n < CACHE_SIEVE_LIMIT:
+        return _sieve_lookup(n)
+    
+    key = ("is_prime", n)
+    result = _lookup(key)
+    if result is not None:
+        _counts["hits"] += 1
+        return result
+    
+    _counts["misses"] += 1
+    result = core.is_prime(n)
+    _store(key, result)
+    return result
+
+
+def record_prime(n):
+    """
+    Remember that n is prime, as established by the uncached is_prime.
+    
+    Later is_prime and miller_rabin_test calls on n are hits.
+    
+    Args:
+        n (int): Number already found to be prime
+    """
+    if n >= CACHE_SIEVE_LIMIT:
+        _store(("is_prime", n), True)
+
+
+def miller_rabin_test(n, k=None):
+    """
+    Miller-Rabin primality test for large numbers, remembering the answer.
+    
+    A composite verdict is final. A probable prime is remembered with the
+    number of random rounds it passed, so asking again with at most that
+    many rounds is a hit and asking with more tests it again. A remembered
+    is_prime verdict (which is stronger than any number of rounds) answers
+    for every k. See primality.core.miller_rabin_test for the test itself.
+    
+    Args:
+        n (int): Number to test for primality
+        k (int): Number of random rounds (None picks it from the bit length,
+            assuming n is a random candidate)
+    
+    Returns:
+        bool: True if n is probably prime, False if n is definitely composite
+    """
+    if n < CACHE_SIEVE_LIMIT:
+        return _sieve_lookup(n)
+    if k is None:
+        k = core.miller_rabin_rounds(n.bit_length())
+    
+    verdict = _lookup(("is_prime", n))
+    if verdict is not None:
+        _counts["hits"] += 1
+        return verdict
+    
+    key = ("miller_rabin_test", n)
+    rounds = _lookup(key)  # -1 for composites
+    if rounds is not None and (rounds < 0 or rounds >= k):
+        _counts["hits"] += 1
+        return rounds >= 0
+    
+    _counts["misses"] += 1
+    result = core.miller_rabin_test(n, k)
+    _store(key, k if result else -1)
+    return result
+
+
+def factorize(n):
+    """
+    Find prime factorization of n, remembering the answer.
+    
+    Args:
+        n (int): Number to factorize
+    
+    Returns:
+        list: New list of prime factors in non-decreasing order
+    """
+    if n < CACHE_SIEVE_LIMIT:
+        return factor.factorize(n)
+    
+    key = ("factorize", n)
+    factors = _lookup(key)
+    if factors is not None:
+        _counts["hits"] += 1
+        return list(factors)
+    
+    _counts["misses"] += 1
+    factors = factor.factorize(n)
+    _store(key, tuple(factors))
+    return factors
+
+
+def configure_cache(max_entries=CACHE_MAX_ENTRIES, max_bytes=None):
+    """
+    Set the bounds of the result table, evicting entries beyond them.
+    
+    Args:
+        max_entries (int): Largest number of entries, or None for no limit
+        max_bytes (int): Largest estimated size in bytes, or None for no limit
+    """
+    global _max_entries, _max_bytes
+    
+    _max_entries, _max_bytes = max_entries, max_bytes
+    _evict()
+
+
+def cache_info():
+    """
+    Report how the result cache has been used.
+    
+    Returns:
+        dict: {"hits", "misses", "sieve_hits", "entries", "bytes",
+        "max_entries", "max_bytes"}, where sieve_hits counts the numbers
+        answered from the bitmap
+    """
+    return {
+        **_counts,
+        "entries": len(_entries),
+        "bytes": _entry_bytes,
+        "max_entries": _max_entries,
+        "max_bytes": _max_bytes,
+    }
+
+
+def cache_clear():
+    """Empty the result table and reset the hit and miss counts."""
+    global _entry_bytes
+    
+    _entries.clear()
+    _entry_bytes = 0
+    for name in _counts:
+        _counts[name] = 0
@@ -0,0 +1,81 @@
+"""
+Checkpoint files for long scans, so they can resume after a crash.
+
+A checkpoint is a small JSON file holding the parameters that identify the
+scan, the point up to which it is complete and its partial results. Each
+write goes to a temporary file that is flushed to disk and then renamed
+over the old checkpoint, so a crash leaves either the old or the new file,
+never a torn one. Writes are rate-limited to one every CHECKPOINT_INTERVAL
+seconds, which keeps their cost negligible next to the scan itself.
+"""
+
+import json
+import os
+import time
+
+CHECKPOINT_INTERVAL = 5.0  # seconds between checkpoint writes
+
+
+def write_checkpoint(path, state):
+    """
+    Atomically replace the checkpoint file at path with state.
+    
+    Args:
+        path (str): Checkpoint file
+        state (dict): JSON-serializable scan state
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(state, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path, scan):
+    """
+    Read the checkpoint of a scan, if there is one.
+    
+    Args:
+        path (str): Checkpoint file
+        scan (dict): Parameters identifying the scan, as passed to
+            checkpoint_writer
+    
+    Returns:
+        dict: Saved state, or None if the file does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        state = json.load(f)
+    if state.get("scan") != scan:
+        raise ValueError(f"checkpoint {path!r} belongs to a different scan")
+    return state
+
+
+def checkpoint_writer(path, scan, interval=CHECKPOINT_INTERVAL):
+    """
+    Make a function that writes the progress of a scan at most every interval seconds.
+    
+    Args:
+        path (str): Checkpoint file, or None to disable checkpointing
+        scan (dict): JSON-serializable parameters identifying the scan
+        interval (float): Smallest number of seconds between writes
+    
+    Returns:
+        callable: save(state, force=False), which writes the scan
+        parameters and the state dict when a write is due or force is True
+    """
+    last_write = time.monotonic()
+    
+    def save(state, force=False):
+        nonlocal last_write
+        
+        if path is None:
+            return
+        now = time.monotonic()
+        if force or now - last_write >= interval:
+            write_checkpoint(path, {"scan": scan, **state})
+            last_write = now
+    
+    return save
@@ -0,0 +1,217 @@
+"""
+Primality testing: trial division, deterministic Miller-Rabin and
+Baillie-PSW, plus a probabilistic Miller-Rabin test with random bases.
+"""
+
+import random
+from math import gcd, isqrt, prod
+
+from .backend import is_strong_prp, mpz
+
+
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# Deterministic Miller-Rabin witness sets: every n below the bound is
+# classified exactly by the listed bases (Jaeschke; Sorenson and Webster).
+MILLER_RABIN_WITNESSES = (
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+)
+
+# Product of the odd primes below 1000, for a one-gcd small factor check
+SMALL_PRIMORIAL = prod(
+    p for p in range(3, 1000, 2)
+    if all(p % q for q in range(3, isqrt(p) + 1, 2))
+)
+
+# Miller-Rabin rounds giving error < 2^-80 on random candidates of at least
+# the given bit length: OpenSSL's BN_prime_checks_for_size, which it derives
+# from the Damgard-Landrock-Pomerance average-case bounds
+MILLER_RABIN_ROUNDS = (
+    (3747, 3),
+    (1345, 4),
+    (476, 5),
+    (400, 6),
+    (347, 7),
+    (308, 8),
+    (55, 27),
+    (0, 34),
+)
+
+
+def _jacobi_symbol(a, n):
+    """
+    Compute the Jacobi symbol (a/n) for odd positive n.
+    
+    Args:
+        a (int): Numerator (any integer)
+        n (int): Odd positive denominator
+        
+    Returns:
+        int: -1, 0 or 1
+    """
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _is_strong_lucas_probable_prime(n):
+    """
+    Run the strong Lucas probable prime test with Selfridge's parameters.
+    
+    Args:
+        n (int): Odd number that is not a perfect square and has no small factors
+        
+    Returns:
+        bool: False if n is proven composite, True otherwise
+    """
+    n = mpz(n)
+    
+    # Selfridge: first D in 5, -7, 9, -11, ... with (D/n) = -1
+    D = 5
+    while True:
+        j = _jacobi_symbol(D, n)
+        if j == -1:
+            break
+        if j == 0:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    Q = (1 - D) // 4  # P = 1
+    
+    # Write n + 1 as d * 2^s
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    # Left-to-right binary ladder for U_d, V_d and Q^d (mod n)
+    U, V, Qk = 1, 1, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = U + V, D * U + V
+            if U % 2:
+                U += n
+            if V % 2:
+                V += n
+            U = U // 2 % n
+            V = V // 2 % n
+            Qk = Qk * Q % n
+    
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def is_prime(n):
+    """
+    Determines if a positive integer is prime.
+    
+    The test is tiered: trial division by the primes below 100, then
+    deterministic Miller-Rabin with a proven witness set for
+    n < 3.3 * 10^24, then Baillie-PSW for anything larger (no Baillie-PSW
+    counterexample is known).
+    
+    Args:
+        n (int): A positive integer to check for primality
+        
+    Returns:
+        bool: True if n is prime, False otherwise
+    """
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < 101 * 101:
+        return True
+    
+    for bound, witnesses in MILLER_RABIN_WITNESSES:
+        if n < bound:
+            return all(is_strong_prp(n, a) for a in witnesses)
+    
+    # Baillie-PSW: strong base-2 test plus strong Lucas test
+    if not is_strong_prp(n, 2):
+        return False
+    if isqrt(n) ** 2 == n:
+        return False
+    return _is_strong_lucas_probable_prime(n)
+
+
+def miller_rabin_rounds(bits):
+    """
+    Number of random-base Miller-Rabin rounds needed for a given size.
+    
+    Args:
+        bits (int): Bit length of the candidate
+        
+    Returns:
+        int: Rounds giving error probability below 2^-80 for random candidates
+        (not for numbers that may have been chosen to fool the test)
+    """
+    for min_bits, rounds in MILLER_RABIN_ROUNDS:
+        if bits >= min_bits:
+            return rounds
+
+
+def miller_rabin_test(n, k=None):
+    """
+    Miller-Rabin primality test for large numbers.
+    
+    Almost every composite is rejected before any random base is drawn: by
+    one gcd against the odd primes below 1000, then by a strong test to the
+    fixed base 2. Survivors get k more rounds with random bases. The
+    package's miller_rabin_test remembers the results (see cache.py).
+    
+    The default round count from miller_rabin_rounds is only sound for
+    random candidates, such as those of a prime search. For a number that
+    may have been picked to pass the test, pass k: k rounds bound the error
+    by 4^-k for every n.
+    
+    Args:
+        n (int): Number to test for primality
+        k (int): Number of random rounds (None picks it from the bit length,
+            assuming n is a random candidate)
+        
+    Returns:
+        bool: True if n is probably prime, False if n is definitely composite
+    """
+    if n < 1000:
+        return is_prime(n)
+    if n % 2 == 0 or gcd(n, SMALL_PRIMORIAL) != 1:
+        return False
+    
+    if k is None:
+        k = miller_rabin_rounds(n.bit_length())
+    if not is_strong_prp(n, 2):
+        return False
+    for _ in range(k):
+        if not is_strong_prp(n, random.randrange(2, n - 1)):
+            return False
+    return True
@@ -0,0 +1,166 @@
+"""
+Sublinear prime counting with the Lucy_Hedgehog algorithm.
+
+S(v) starts as the number of integers 2..v and, for each prime p up to
+sqrt(n), loses the integers whose smallest prime factor is p:
+
+    S(v) -= S(v // p) - S(p - 1)    for every v >= p²
+
+Only the O(sqrt n) distinct values n // i are ever needed, kept in two
+tables (v <= sqrt n by v, larger v by i = n // v), so memory is O(sqrt n)
+and time O(n^(3/4)). NumPy is optional; when installed every update is
+done on whole slices at once. Run this module (python -m primality.counting)
+to print a benchmark table.
+"""
+
+import time
+from bisect import bisect_right
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from .sieve import primes_up_to
+
+SIEVE_COUNT_LIMIT = 1 << 16  # below this π(n) is read off the prime table
+
+
+def _lucy_python(n):
+    """
+    Pure-Python Lucy_Hedgehog prime count.
+    
+    Args:
+        n (int): Upper bound (at least SIEVE_COUNT_LIMIT)
+    
+    Returns:
+        int: π(n)
+    """
+    r = isqrt(n)
+    small = [v - 1 for v in range(r + 1)]  # small[v] = S(v)
+    small[0] = 0
+    large = [0] + [n // i - 1 for i in range(1, r + 1)]  # large[i] = S(n // i)
+    
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p is not prime
+        sp = small[p - 1]
+        p2 = p * p
+        last = min(r, n // p2)
+        inside = min(last, r // p)  # n // (i * p) is still a large index
+        
+        large[1:inside + 1] = [
+            a - b + sp for a, b in zip(large[1:inside + 1], large[p:inside * p + 1:p])
+        ]
+        large[inside + 1:last + 1] = [
+            large[i] - small[n // (i * p)] + sp for i in range(inside + 1, last + 1)
+        ]
+        small[p2:] = [
+            a - small[v // p] + sp for a, v in zip(small[p2:], range(p2, r + 1))
+        ]
+    
+    return large[1]
+
+
+def _lucy_numpy(n):
+    """
+    Lucy_Hedgehog prime count with whole-slice NumPy updates.
+    
+    Args:
+        n (int): Upper bound (at least SIEVE_COUNT_LIMIT, below 2^63)
+    
+    Returns:
+        int: π(n)
+    """
+    r = isqrt(n)
+    small = np.arange(-1, r, dtype=np.int64)  # small[v] = S(v)
+    small[0] = 0
+    index = np.arange(1, r + 1, dtype=np.int64)
+    large = np.empty(r + 1, dtype=np.int64)  # large[i] = S(n // i)
+    large[0] = 0
+    large[1:] = n // index - 1
+    quotients = np.arange(r + 1, dtype=np.int64)
+    
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p is not prime
+        sp = small[p - 1]
+        p2 = p * p
+        last = min(r, n // p2)
+        inside = min(last, r // p)
+        
+        large[1:inside + 1] -= large[p:inside * p + 1:p] - sp
+        if last > inside:
+            large[inside + 1:last + 1] -= small[n // (index[inside:last] * p)] - sp
+        if p2 <= r:
+            small[p2:] -= small[quotients[p2:] // p] - sp
+    
+    return int(large[1])
+
+
+def count_primes(n):
+    """
+    Count the primes <= n (the prime-counting function π(n)).
+    
+    Small n are answered from the shared prime table; larger n with the
+    Lucy_Hedgehog algorithm in O(n^(3/4)) time and O(sqrt n) memory.
+    
+    Args:
+        n (int): Upper bound
+    
+    Returns:
+        int: Number of primes p <= n
+    """
+    if n < SIEVE_COUNT_LIMIT:
+        return bisect_right(primes_up_to(SIEVE_COUNT_LIMIT), n) if n >= 2 else 0
+    if np is not None and n < 1 << 62:
+        return _lucy_numpy(n)
+    return _lucy_python(n)
+
+
+def benchmark_count_primes(exponents=(6, 7, 8, 9, 10, 11)):
+    """
+    Time count_primes for n = 10^k, against the segmented sieve up to 10^8.
+    
+    Args:
+        exponents (tuple): Values of k
+    
+    Returns:
+        list: List of tuples (k, π(10^k), lucy_seconds, sieve_seconds),
+        where sieve_seconds is None above 10^8
+    """
+    from .sieve import segmented_sieve
+    
+    rows = []
+    for k in exponents:
+        n = 10 ** k
+        start = time.perf_counter()
+        count = count_primes(n)
+        lucy_seconds = time.perf_counter() - start
+        
+        sieve_seconds = None
+        if k <= 8:
+            start = time.perf_counter()
+            sieve_count = sum(1 for _ in segmented_sieve(n))
+            sieve_seconds = time.perf_counter() - start
+            if sieve_count != count:
+                raise AssertionError(f"π(10^{k}): Lucy gave {count}, the sieve {sieve_count}")
+        
+        rows.append((k, count, lucy_seconds, sieve_seconds))
+    return rows
+
+
+def main():
+    """Print the prime counting benchmark table."""
+    print(f"Lucy_Hedgehog prime counting ({'NumPy' if np is not None else 'pure Python'})")
+    print("=" * 50)
+    print(f"{'n':>6} {'π(n)':>14} {'lucy (s)':>10} {'sieve (s)':>10}")
+    
+    for k, count, lucy_seconds, sieve_seconds in benchmark_count_primes():
+        sieve = f"{sieve_seconds:10.3f}" if sieve_seconds is not None else f"{'-':>10}"
+        print(f"{'10^' + str(k):>6} {count:14d} {lucy_seconds:10.3f} {sieve}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Integer factorization: trial division over the shared prime table, Pollard
+rho with Brent's cycle detection, and a small elliptic curve method (ECM)
+stage for factors that are too large for rho.
+"""
+
+import random
+from bisect import bisect_right
+from math import gcd, isqrt
+
+from .core import is_prime
+from .sieve import prime_table, primes_between
+
+TRIAL_DIVISION_LIMIT = 1 << 16  # trial divide by every prime below this
+RHO_MAX_STEPS = 1 << 17  # rho iterations per attempt before moving on to ECM
+RHO_BATCH = 128  # products accumulated between gcds
+
+# (B1, number of curves) per ECM round, sized for factors of roughly
+# 15, 20, 25 and 30 digits
+ECM_SCHEDULE = (
+    (2000, 25),
+    (11000, 90),
+    (50000, 300),
+    (250000, 700),
+)
+
+
+def _integer_root(n, k):
+    """
+    Compute floor(n ** (1/k)) exactly with Newton's method.
+    
+    Args:
+        n (int): Non-negative integer
+        k (int): Root degree (k >= 2)
+    
+    Returns:
+        int: Largest r with r^k <= n
+    """
+    if n < 2:
+        return n
+    r = 1 << ((n.bit_length() + k - 1) // k)  # r^k >= n
+    while True:
+        s = ((k - 1) * r + n // r ** (k - 1)) // k
+        if s >= r:
+            return r
+        r = s
+
+
+def _perfect_power(n):
+    """
+    Write n as r^k with k prime, if possible.
+    
+    Args:
+        n (int): Integer greater than 1
+    
+    Returns:
+        tuple: (r, k) with r^k == n, or None if n is not a perfect power
+    """
+    for k in primes_between(2, n.bit_length() + 1):
+        r = _integer_root(n, k)
+        if r ** k == n:
+            return r, k
+    return None
+
+
+def pollard_rho_brent(n, max_steps=RHO_MAX_STEPS, seed=None):
+    """
+    Find a non-trivial factor of composite n with Pollard rho (Brent's variant).
+    
+    Brent's cycle detection doubles the stride instead of running two
+    sequences, and the differences are multiplied together so that only one
+    gcd is taken per RHO_BATCH steps.
+    
+    Args:
+        n (int): Odd composite number
+        max_steps (int): Give up after roughly this many iterations
+        seed (int): Seed for the random polynomial x² + c and start value
+    
+    Returns:
+        int: A factor 1 < d < n, or None if none was found within max_steps
+    """
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(seed)
+    
+    while True:
+        y = rng.randrange(1, n)
+        c = rng.randrange(1, n)
+        g = r = q = 1
+        steps = 0
+        
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += RHO_BATCH
+            steps += 2 * r
+            r *= 2
+            if g == 1 and steps > max_steps:
+                return None
+        
+        if g == n:
+            # The batch overshot; replay it one step at a time
+            while True:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+                if g > 1:
+                    break
+        if g != n:
+            return g
+
+
+def _x_double(x, z, n, a24):
+    """Double the point (x : z) on a Montgomery curve."""
+    s = (x + z) * (x + z) % n
+    d = (x - z) * (x - z) % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def _x_add(xp, zp, xq, zq, xd, zd, n):
+    """Add (xp : zp) and (xq : zq) given their difference (xd : zd)."""
+    u = (xp - zp) * (xq + zq)
+    v = (xp + zp) * (xq - zq)
+    return zd * (u + v) * (u + v) % n, xd * (u - v) * (u - v) % n
+
+
+def _ladder(k, x, z, n, a24):
+    """Compute k * (x : z) with the Montgomery ladder."""
+    x0, z0 = x, z
+    x1, z1 = _x_double(x, z, n, a24)
+    for bit in bin(k)[3:]:
+        if bit == "1":
+            x0, z0 = _x_add(x1, z1, x0, z0, x, z, n)
+            x1, z1 = _x_double(x1, z1, n, a24)
+        else:
+            x1, z1 = _x_add(x0, z0, x1, z1, x, z, n)
+            x0, z0 = _x_double(x0, z0, n, a24)
+    return x0, z0
+
+
+def ecm_one_curve(n, b1, sigma):
+    """
+    Run one ECM curve (stage 1 up to b1, stage 2 up to 100 * b1).
+    
+    Uses a Montgomery curve with Suyama's parametrization and x-only
+    arithmetic, so no modular inverse is needed after the curve setup.
+    
+    Args:
+        n (int): Composite number with no small factors
+        b1 (int): Stage 1 smoothness bound
+        sigma (int): Curve parameter (6 <= sigma < n)
+    
+    Returns:
+        int: A factor 1 < d < n, or None if this curve found nothing
+    """
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+    denominator = 16 * pow(u, 3, n) * v % n
+    g = gcd(denominator, n)
+    if g != 1:
+        return g if g != n else None
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+    
+    # Stage 1: multiply by every prime power <= b1
+    for p in prime_table(b1):
+        if p > b1:
+            break
+        power = p
+        while power * p <= b1:
+            power *= p
+        x, z = _ladder(power, x, z, n, a24)
+    g = gcd(z, n)
+    if g != 1:
+        return g if g != n else None
+    
+    # Stage 2: one prime q in (b1, b2] at a time, using the precomputed
+    # multiples S[d] = 2d * Q and a running pair R = r * Q, T = (r - 2D) * Q
+    b2 = 100 * b1
+    r = b1 - 1 if b1 % 2 == 0 else b1  # odd, so q - r is even
+    d_max = min(isqrt(b2), (r - 1) // 2)
+    sx, sz = [0] * (d_max + 1), [0] * (d_max + 1)
+    beta = [0] * (d_max + 1)
+    sx[1], sz[1] = _x_double(x, z, n, a24)
+    sx[2], sz[2] = _x_double(sx[1], sz[1], n, a24)
+    for d in range(3, d_max + 1):
+        sx[d], sz[d] = _x_add(sx[d - 1], sz[d - 1], sx[1], sz[1], sx[d - 2], sz[d - 2], n)
+    for d in range(1, d_max + 1):
+        beta[d] = sx[d] * sz[d] % n
+    
+    tx, tz = _ladder(r - 2 * d_max, x, z, n, a24)
+    rx, rz = _ladder(r, x, z, n, a24)
+    primes = prime_table(b2 + 2 * d_max)
+    i = bisect_right(primes, r)
+    g = 1
+    
+    while r < b2:
+        alpha = rx * rz % n
+        while primes[i] <= r + 2 * d_max:
+            delta = (primes[i] - r) // 2
+            g = g * ((rx - sx[delta]) * (rz + sz[delta]) - alpha + beta[delta]) % n
+            i += 1
+        tx, tz, (rx, rz) = rx, rz, _x_add(rx, rz, sx[d_max], sz[d_max], tx, tz, n)
+        r += 2 * d_max
+    
+    g = gcd(g, n)
+    return g if 1 < g < n else None
+
+
+def ecm(n, schedule=ECM_SCHEDULE, seed=None):
+    """
+    Find a non-trivial factor of composite n with the elliptic curve method.
+    
+    Args:
+        n (int): Composite number that is not a perfect power
+        schedule (tuple): Sequence of (B1, number of curves) rounds
+        seed (int): Seed for the random curve parameters
+    
+    Returns:
+        int: A factor 1 < d < n, or None if every curve failed
+    """
+    rng = random.Random(seed)
+    
+    for b1, curves in schedule:
+        for _ in range(curves):
+            d = ecm_one_curve(n, b1, rng.randrange(6, n))
+            if d is not None:
+                return d
+    return None
+
+
+def _find_factor(n, seed):
+    """
+    Find any non-trivial factor of a composite n with no small prime factors.
+    
+    Args:
+        n (int): Odd composite number that is not a perfect power
+        seed (int): Seed shared by the randomized methods
+    
+    Returns:
+        int: A factor 1 < d < n
+    """
+    d = pollard_rho_brent(n, seed=seed)
+    if d is None:
+        d = ecm(n, seed=seed)
+    if d is None:
+        d = pollard_rho_brent(n, max_steps=float("inf"), seed=seed)
+    return d
+
+
+def factorint(n, seed=0):
+    """
+    Find the prime factorization of n as a {prime: exponent} map.
+    
+    Small factors are removed by trial division over the shared prime table;
+    what is left is split with Pollard rho (Brent) and, if rho stalls, ECM.
+    Rho finds factors of up to about 10 digits within its step budget; a
+    balanced 40-digit semiprime is left to ECM and takes from 2 to about
+    20 seconds, depending on how many curves it needs.
+    
+    Args:
+        n (int): Positive integer to factorize
+        seed (int): Seed for the randomized methods (results are the same
+            for every seed; only the running time changes)
+    
+    Returns:
+        dict: Map from each prime factor to its exponent ({} for n = 1)
+    """
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    
+    factors = {}
+    for p in prime_table(TRIAL_DIVISION_LIMIT):
+        if p >= TRIAL_DIVISION_LIMIT or p * p > n:
+            break  # the shared table may have been grown past the limit
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    
+    pending = [(n, 1)] if n > 1 else []
+    while pending:
+        m, multiplicity = pending.pop()
+        if m < TRIAL_DIVISION_LIMIT ** 2 or is_prime(m):
+            # Every factor below the trial division limit is gone, so m is prime
+            factors[m] = factors.get(m, 0) + multiplicity
+            continue
+        
+        power = _perfect_power(m)
+        if power is not None:
+            root, k = power
+            pending.append((root, multiplicity * k))
+            continue
+        
+        d = _find_factor(m, seed)
+        pending.append((d, multiplicity))
+        pending.append((m // d, multiplicity))
+    
+    return dict(sorted(factors.items()))
+
+
+def factorize(n):
+    """
+    Find prime factorization of n.
+    
+    Args:
+        n (int): Number to factorize
+    
+    Returns:
+        list: List of prime factors in non-decreasing order
+    """
+    if n < 2:
+        return []
+    return [p for p, exponent in factorint(n).items() for _ in range(exponent)]
@@ -0,0 +1,95 @@
+"""
+Mersenne numbers 2^p - 1: trial factoring and the Lucas-Lehmer test.
+"""
+
+from .backend import mpz
+from .sieve import primes_between
+
+
+TRIAL_FACTOR_K = 2000  # candidates 2kp + 1 tried before Lucas-Lehmer
+
+
+def mersenne_trial_factor(p, max_k=TRIAL_FACTOR_K):
+    """
+    Look for a small factor of 2^p - 1 among the candidates q = 2kp + 1.
+    
+    For an odd prime p every prime factor of 2^p - 1 has that form and
+    satisfies q ≡ ±1 (mod 8), so most candidates are skipped without any
+    arithmetic on the (large) Mersenne number itself.
+    
+    Args:
+        p (int): Odd prime exponent
+        max_k (int): Largest multiplier k to try
+        
+    Returns:
+        int: A proper factor of 2^p - 1, or None if none was found
+    """
+    mersenne_number = (1 << p) - 1
+    
+    for k in range(1, max_k + 1):
+        q = 2 * k * p + 1
+        if q * q > mersenne_number:
+            break
+        if q % 8 not in (1, 7):
+            continue
+        if pow(2, p, q) == 1:
+            return q
+    return None
+
+
+def lucas_lehmer(p):
+    """
+    Lucas-Lehmer test: decide whether 2^p - 1 is prime for a prime p.
+    
+    The sequence s -> s² - 2 is reduced modulo M = 2^p - 1 with shifts and
+    masks, using 2^p ≡ 1 (mod M), instead of a full division.
+    
+    Args:
+        p (int): Prime exponent
+        
+    Returns:
+        bool: True if 2^p - 1 is prime, False otherwise
+    """
+    if p == 2:
+        return True
+    
+    mersenne_number = mpz((1 << p) - 1)
+    s = mpz(4)
+    for _ in range(p - 2):
+        s = s * s + mersenne_number - 2  # stays non-negative
+        while s > mersenne_number:
+            s = (s & mersenne_number) + (s >> p)
+    return s == 0 or s == mersenne_number
+
+
+def is_mersenne_prime(p, max_k=TRIAL_FACTOR_K):
+    """
+    Decide whether 2^p - 1 is prime, trial factoring before Lucas-Lehmer.
+    
+    Args:
+        p (int): Prime exponent
+        max_k (int): Largest trial factoring multiplier k
+        
+    Returns:
+        bool: True if 2^p - 1 is prime, False otherwise
+    """
+    if p > 2 and mersenne_trial_factor(p, max_k) is not None:
+        return False
+    return lucas_lehmer(p)
+
+
+def mersenne_table(lo, hi, max_k=TRIAL_FACTOR_K):
+    """
+    Test 2^p - 1 for every prime p in [lo, hi).
+    
+    The signature fits parallel_range_map.
+    
+    Args:
+        lo (int): Lower bound for p (inclusive)
+        hi (int): Upper bound for p (exclusive)
+        max_k (int): Largest trial factoring multiplier k
+    
+    Returns:
+        list: List of tuples (p, mersenne_number, is_prime)
+    """
+    return [(p, (1 << p) - 1, is_mersenne_prime(p, max_k)) for p in primes_between(lo, hi)]
@@ -0,0 +1,130 @@
+"""
+Range-partitioning executor for scans over n = lo, lo + 1, ..., hi - 1.
+
+The range is cut into chunks whose sizes double from min_chunk (so a scan
+that stops early does little wasted work) up to a guided size of the
+remaining length over twice the worker count (so the last, usually most
+expensive, chunks are small). Chunks are handed to a process pool through
+its shared queue: an idle worker always takes the next chunk, which
+balances uneven chunk costs without per-worker queues. Results are yielded
+in range order, and a scan can be cancelled at the first result matching a
+predicate, such as the first composite value of a polynomial.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+IN_FLIGHT_PER_WORKER = 4  # chunks queued or running per worker
+
+
+def range_chunks(lo, hi, workers=1, min_chunk=1, max_chunk=None):
+    """
+    Split [lo, hi) into consecutive chunks for workers processes.
+    
+    Args:
+        lo (int): Lower bound of the range (inclusive)
+        hi (int): Upper bound of the range (exclusive)
+        workers (int): Number of workers sharing the chunks
+        min_chunk (int): Size of the first (and smallest) chunks
+        max_chunk (int): Largest chunk size, or None for no limit
+    
+    Yields:
+        tuple: (chunk_lo, chunk_hi) covering [lo, hi) in order
+    """
+    size = max(1, min_chunk)
+    while lo < hi:
+        guided = -(-(hi - lo) // (2 * workers))
+        step = max(min_chunk, min(size, guided, max_chunk or guided))
+        yield lo, min(lo + step, hi)
+        lo += step
+        size *= 2
+
+
+def _cut_at(results, cancel_on):
+    """
+    Cut a chunk's results after the first one matching cancel_on.
+    
+    Args:
+        results (list): Results of one chunk
+        cancel_on (callable): Predicate on a single result, or None
+    
+    Returns:
+        tuple: (results, stop) where stop is True if a result matched
+    """
+    if cancel_on is not None:
+        for i, result in enumerate(results):
+            if cancel_on(result):
+                return results[:i + 1], True
+    return results, False
+
+
+def _pool_results(pool, function, chunks, in_flight):
+    """
+    Submit chunks to a pool and yield their results in submission order.
+    
+    Args:
+        pool (ProcessPoolExecutor): Worker pool
+        function (callable): function(chunk_lo, chunk_hi) run by the workers
+        chunks (iterator): (chunk_lo, chunk_hi) tuples
+        in_flight (int): Largest number of submitted, unconsumed chunks
+    
+    Yields:
+        tuple: (chunk_lo, chunk_hi, results)
+    """
+    pending = deque()
+    for chunk_lo, chunk_hi in chunks:
+        pending.append((chunk_lo, chunk_hi, pool.submit(function, chunk_lo, chunk_hi)))
+        if len(pending) >= in_flight:
+            chunk_lo, chunk_hi, future = pending.popleft()
+            yield chunk_lo, chunk_hi, future.result()
+    while pending:
+        chunk_lo, chunk_hi, future = pending.popleft()
+        yield chunk_lo, chunk_hi, future.result()
+
+
+def parallel_range_map(function, lo, hi, max_workers=1, min_chunk=1, max_chunk=None,
+                       cancel_on=None):
+    """
+    Run function over the chunks of [lo, hi) and yield the results in order.
+    
+    With max_workers == 1 the chunks run one after another in this process.
+    Otherwise at most IN_FLIGHT_PER_WORKER chunks per worker are queued, and
+    the pending ones are cancelled as soon as the scan stops.
+    
+    Args:
+        function (callable): function(chunk_lo, chunk_hi) returning the list
+            of results for that chunk, in order; it must be picklable (a
+            module-level function or a functools.partial of one) to run in
+            pool workers
+        lo (int): Lower bound of the range (inclusive)
+        hi (int): Upper bound of the range (exclusive)
+        max_workers (int): Number of worker processes (None for all cores)
+        min_chunk (int): Size of the first (and smallest) chunks
+        max_chunk (int): Largest chunk size, or None for no limit
+        cancel_on (callable): Predicate on a single result; the scan ends
+            after the first result for which it is true
+    
+    Yields:
+        tuple: (chunk_lo, chunk_hi, results) for each chunk in order; the
+        chunk that triggered cancel_on is cut after the matching result
+    """
+    workers = max_workers or os.cpu_count()
+    chunks = range_chunks(lo, hi, workers, min_chunk, max_chunk)
+    
+    if workers == 1:
+        outputs = ((chunk_lo, chunk_hi, function(chunk_lo, chunk_hi)) for chunk_lo, chunk_hi in chunks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        outputs = _pool_results(pool, function, chunks, IN_FLIGHT_PER_WORKER * workers)
+    
+    try:
+        for chunk_lo, chunk_hi, results in outputs:
+            results, stop = _cut_at(results, cancel_on)
+            yield chunk_lo, chunk_hi, results
+            if stop:
+                return
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
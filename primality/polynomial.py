@@ -0,0 +1,358 @@
+"""
+Prime values of integer polynomials, found by sieving instead of testing.
+
+For each small prime p the roots of f(n) ≡ 0 (mod p) are solved once, as in
+the quadratic sieve; then every n in a segment with n ≡ root (mod p) is
+crossed off with one slice assignment. Only the survivors are evaluated,
+and only those too large to be proven prime by the sieve itself reach a
+primality test.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from math import isqrt
+
+from . import stats
+from .batch import is_prime_batch
+from .factor import factorize
+from .sieve import SEGMENT_SIZE, primes_up_to
+
+POLYNOMIAL_SIEVE_LIMIT = 1 << 20  # largest sieving prime for degree <= 2
+GENERIC_ROOT_LIMIT = 2000  # roots of higher degree polynomials are searched for
+
+
+def polynomial_value(coefficients, n):
+    """
+    Evaluate an integer polynomial with Horner's rule.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first,
+            e.g. (1, 1, 41) for n² + n + 41
+        n (int): Point of evaluation
+    
+    Returns:
+        int: f(n)
+    """
+    value = 0
+    for c in coefficients:
+        value = value * n + c
+    return value
+
+
+def _sqrt_mod(a, p):
+    """
+    Find a square root of a modulo an odd prime p (Tonelli-Shanks).
+    
+    Args:
+        a (int): Quadratic residue modulo p
+        p (int): Odd prime
+    
+    Returns:
+        int: r with r² ≡ a (mod p)
+    """
+    a %= p
+    if a == 0:
+        return 0
+    if p % 4 == 3:
+        return pow(a, (p + 1) // 4, p)
+    
+    q, s = p - 1, 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+    
+    m, c, t, r = s, pow(z, q, p), pow(a, q, p), pow(a, (q + 1) // 2, p)
+    while t != 1:
+        i, t2 = 0, t
+        while t2 != 1:
+            t2 = t2 * t2 % p
+            i += 1
+        b = pow(c, 1 << (m - i - 1), p)
+        m, c, t, r = i, b * b % p, t * b * b % p, r * b % p
+    return r
+
+
+def polynomial_roots_mod(coefficients, p):
+    """
+    Solve f(n) ≡ 0 (mod p) for a prime p.
+    
+    Linear and quadratic polynomials are solved in closed form (with a
+    modular square root); anything else is searched exhaustively, so p
+    should stay small for those.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first
+        p (int): Prime modulus
+    
+    Returns:
+        list: Sorted residues r in [0, p) with f(r) ≡ 0 (mod p); all of
+        them if f vanishes identically modulo p
+    """
+    reduced = [c % p for c in coefficients]
+    while reduced and reduced[0] == 0:
+        reduced.pop(0)
+    
+    if not reduced:
+        return list(range(p))
+    if len(reduced) == 1:
+        return []
+    if len(reduced) == 2:
+        a, b = reduced
+        return [-b * pow(a, -1, p) % p]
+    if len(reduced) == 3 and p > 2:
+        a, b, c = reduced
+        discriminant = (b * b - 4 * a * c) % p
+        if discriminant and pow(discriminant, (p - 1) // 2, p) != 1:
+            return []
+        root = _sqrt_mod(discriminant, p)
+        inverse = pow(2 * a, -1, p)
+        return sorted({(-b + root) * inverse % p, (-b - root) * inverse % p})
+    
+    return [r for r in range(p) if polynomial_value(reduced, r) % p == 0]
+
+
+def _sieve_primes(coefficients, lo, hi):
+    """
+    Choose the sieving primes for f over [lo, hi).
+    
+    Primes beyond sqrt(max |f|) at the ends of the range cannot prove more
+    values prime, so they are left out for short ranges.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first
+        lo (int): Lower bound of the range (inclusive)
+        hi (int): Upper bound of the range (exclusive)
+    
+    Returns:
+        list: Sieving primes in increasing order
+    """
+    limit = POLYNOMIAL_SIEVE_LIMIT if len(coefficients) <= 3 else GENERIC_ROOT_LIMIT
+    largest = max(abs(polynomial_value(coefficients, lo)),
+                  abs(polynomial_value(coefficients, hi - 1)))
+    return primes_up_to(min(limit, isqrt(largest) + 1))
+
+
+def _small_value_bound(coefficients, bound):
+    """
+    Bound |n| outside of which |f(n)| > bound.
+    
+    For |n| >= 1, |f(n)| >= |n|^(d-1) * (|a_d| * |n| - S) where S is the
+    sum of the other coefficients' absolute values.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first
+            (leading coefficient non-zero, degree at least 1)
+        bound (int): Value bound
+    
+    Returns:
+        int: B such that |f(n)| > bound whenever |n| > B
+    """
+    rest = sum(abs(c) for c in coefficients[1:])
+    return (bound + rest) // abs(coefficients[0]) + 1
+
+
+def polynomial_prime_flags(coefficients, lo, hi, segment_size=SEGMENT_SIZE):
+    """
+    Yield primality flags of f(n) for n in [lo, hi), one segment at a time.
+    
+    A value counts as prime only if it is a positive prime.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first
+            (degree at least 1)
+        lo (int): Lower bound of the range (inclusive)
+        hi (int): Upper bound of the range (exclusive)
+        segment_size (int): Number of n values per segment
+    
+    Yields:
+        tuple: (low, flags) where byte i of the bytearray flags is 1 if
+        f(low + i) is prime, 0 otherwise
+    """
+    coefficients = tuple(coefficients)
+    while len(coefficients) > 1 and coefficients[0] == 0:
+        coefficients = coefficients[1:]
+    if len(coefficients) < 2:
+        raise ValueError("the polynomial must have degree at least 1")
+    if lo >= hi:
+        return
+    
+    primes = _sieve_primes(coefficients, lo, hi)
+    roots = [(p, polynomial_roots_mod(coefficients, p)) for p in primes]
+    proven = primes[-1] ** 2 if primes else 2  # survivors below this are prime
+    
+    for low in range(lo, hi, segment_size):
+        high = min(low + segment_size, hi)
+        size = high - low
+        flags = bytearray([1]) * size
+        if stats.ENABLED:
+            stats.count("sieve_segments")
+        
+        for p, residues in roots:
+            # n with f(n) == p lie within [-bound, bound]; they must survive
+            bound = _small_value_bound(coefficients, p)
+            for r in residues:
+                index = (r - low) % p
+                if index >= size:
+                    continue
+                flags[index::p] = bytes(len(range(index, size, p)))
+                first = max(low, -bound)
+                first += (r - first) % p
+                for n in range(first, min(high, bound + 1), p):
+                    if polynomial_value(coefficients, n) == p:
+                        flags[n - low] = 1
+        
+        survivors = list(compress(range(low, high), flags))
+        values = [polynomial_value(coefficients, n) for n in survivors]
+        pending = [i for i, value in enumerate(values) if value >= proven]
+        if stats.ENABLED:
+            stats.count("candidates", len(pending))
+        tested = is_prime_batch([values[i] for i in pending]) if pending else []
+        verdicts = [value > 1 for value in values]
+        for i, is_prime_result in zip(pending, tested):
+            verdicts[i] = bool(is_prime_result)
+        for n, verdict in zip(survivors, verdicts):
+            if not verdict:
+                flags[n - low] = 0
+        
+        yield low, flags
+
+
+def polynomial_primes_between(coefficients, lo, hi, segment_size=SEGMENT_SIZE):
+    """
+    Yield every n in [lo, hi) for which f(n) is prime, in increasing order.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first
+        lo (int): Lower bound of the range (inclusive)
+        hi (int): Upper bound of the range (exclusive)
+        segment_size (int): Number of n values per segment
+    
+    Yields:
+        int: Next n with f(n) prime
+    """
+    for low, flags in polynomial_prime_flags(coefficients, lo, hi, segment_size):
+        yield from compress(range(low, low + len(flags)), flags)
+
+
+def polynomial_table(coefficients, lo, hi, factor_composites=True):
+    """
+    Tabulate f(n) for n in [lo, hi) with its primality and factorization.
+    
+    The signature fits parallel_range_map once the coefficients are bound
+    with functools.partial.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first
+        lo (int): Lower bound of the range (inclusive)
+        hi (int): Upper bound of the range (exclusive)
+        factor_composites (bool): If True, factor composite values above 1
+    
+    Returns:
+        list: List of tuples (n, f(n), is_prime, factors) where factors is
+        None for primes and values below 2
+    """
+    rows = []
+    for low, flags in polynomial_prime_flags(coefficients, lo, hi):
+        for n, is_prime_result in zip(range(low, low + len(flags)), flags):
+            value = polynomial_value(coefficients, n)
+            factors = None
+            if factor_composites and not is_prime_result and value > 1:
+                factors = factorize(value)
+            rows.append((n, value, bool(is_prime_result), factors))
+    return rows
+
+
+def explore_polynomial(coefficients, start_n, end_n, segment_size=SEGMENT_SIZE):
+    """
+    Summarize the prime values of f(n) for start_n <= n <= end_n.
+    
+    Args:
+        coefficients (tuple): Integer coefficients, highest degree first
+        start_n (int): Starting value of n
+        end_n (int): Ending value of n (inclusive)
+        segment_size (int): Number of n values per segment
+    
+    Returns:
+        dict: {"coefficients": tuple, "start": start_n, "end": end_n,
+        "primes": count, "density": fraction of prime values,
+        "first_composite": first n with f(n) not prime (or None),
+        "longest_run": (first n, length) of the longest run of consecutive
+        prime values (length 0 if there is none)}
+    """
+    count = 0
+    first_composite = None
+    run_start, run_length = start_n, 0
+    best = (start_n, 0)
+    
+    for low, flags in polynomial_prime_flags(coefficients, start_n, end_n + 1, segment_size):
+        count += flags.count(1)
+        if first_composite is None and 0 in flags:
+            first_composite = low + flags.index(0)
+        
+        # Walk the segment one run of ones (and one gap) at a time
+        i, size = 0, len(flags)
+        while i < size:
+            zero = flags.find(0, i)
+            end = size if zero == -1 else zero
+            if end > i:
+                if run_length == 0:
+                    run_start = low + i
+                run_length += end - i
+                if run_length > best[1]:
+                    best = (run_start, run_length)
+            if zero == -1:
+                break
+            run_length = 0
+            one = flags.find(1, zero)
+            i = size if one == -1 else one
+    
+    total = end_n - start_n + 1
+    return {
+        "coefficients": tuple(coefficients),
+        "start": start_n,
+        "end": end_n,
+        "primes": count,
+        "density": count / total if total > 0 else 0.0,
+        "first_composite": first_composite,
+        "longest_run": best,
+    }
+
+
+def _explore_work(work):
+    """
+    Explore one polynomial; runs inside pool workers.
+    
+    Args:
+        work (tuple): (coefficients, start_n, end_n)
+    
+    Returns:
+        dict: Result of explore_polynomial
+    """
+    return explore_polynomial(*work)
+
+
+def search_polynomials(polynomials, start_n, end_n, max_workers=1):
+    """
+    Explore many polynomials over the same range of n.
+    
+    Args:
+        polynomials (iterable): Coefficient tuples, highest degree first
+        start_n (int): Starting value of n
+        end_n (int): Ending value of n (inclusive)
+        max_workers (int): Number of worker processes (None for all cores)
+    
+    Returns:
+        list: Result of explore_polynomial for each polynomial, in order
+    """
+    work = [(tuple(coefficients), start_n, end_n) for coefficients in polynomials]
+    
+    if max_workers == 1:
+        return list(map(_explore_work, work))
+    
+    workers = max_workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_explore_work, work, chunksize=max(1, len(work) // (4 * workers))))
@@ -0,0 +1,298 @@
+"""
+Enumeration of Fermat pseudoprimes: odd composite n with b^(n-1) ≡ 1 (mod n),
+plus a classifier for strong and Euler-Jacobi pseudoprimes and Carmichael
+numbers.
+
+Primes are skipped with the segmented sieve, and most composites are skipped
+without any modular exponentiation: if a prime p divides a pseudoprime n,
+then ord_p(b) divides n - 1, so n ≡ p (mod p * ord_p(b)). Multiples of small
+primes outside that progression are crossed off a segment at a time.
+"""
+
+from functools import partial
+from itertools import compress
+from math import gcd, isqrt, lcm
+
+from . import stats
+from .backend import powmod
+from .checkpoint import checkpoint_writer, load_checkpoint
+from .core import _jacobi_symbol
+from .factor import factorint
+from .parallel import parallel_range_map
+from .sieve import SEGMENT_SIZE, _small_primes, sieve_segment
+from .spf import spf_factorize
+
+FERMAT_FILTER_LIMIT = 10000  # small primes used to cross off composites
+FERMAT_CHUNK_SIZE = 1 << 24  # largest chunk in find_fermat_pseudoprimes
+
+_INVERT = bytes([1, 0]) + bytes(254)  # translate table swapping 0 and 1
+
+# Per-base filter tables, built on first use
+_fermat_filters = {}
+
+
+def multiplicative_order(a, p):
+    """
+    Compute the multiplicative order of a modulo a prime p.
+    
+    Args:
+        a (int): Integer not divisible by p
+        p (int): Prime modulus
+    
+    Returns:
+        int: Smallest k > 0 with a^k ≡ 1 (mod p)
+    """
+    order = p - 1
+    for q in factorint(p - 1):
+        while order % q == 0 and pow(a, order // q, p) == 1:
+            order //= q
+    return order
+
+
+def _fermat_filter(base):
+    """
+    Return the composite filter for base: (p, period) for each small odd prime.
+    
+    A multiple n of p can only be a pseudoprime when n ≡ p (mod period). The
+    period is None when p divides the base, since then no multiple qualifies.
+    
+    Args:
+        base (int): Fermat base
+    
+    Returns:
+        list: List of (p, period) tuples in increasing order of p
+    """
+    if base not in _fermat_filters:
+        _fermat_filters[base] = [
+            (p, None if base % p == 0 else p * lcm(2, multiplicative_order(base, p)))
+            for p in _small_primes(FERMAT_FILTER_LIMIT)[1:]
+        ]
+    return _fermat_filters[base]
+
+
+def _fermat_candidates(low, high, base, base_primes):
+    """
+    Mark the odd numbers in [low, high) that may still be pseudoprimes.
+    
+    Args:
+        low (int): Odd lower bound of the segment (inclusive, at least 3)
+        high (int): Upper bound of the segment (exclusive)
+        base (int): Fermat base
+        base_primes (list): Odd primes up to at least sqrt(high - 1)
+    
+    Returns:
+        bytearray: Byte i is 1 if low + 2i is composite and not ruled out
+    """
+    candidates = sieve_segment(low, high, base_primes).translate(_INVERT)
+    size = len(candidates)
+    
+    for p, period in _fermat_filter(base):
+        if p >= high:
+            break
+        start = (low + p - 1) // p * p
+        if start % 2 == 0:
+            start += p
+        index = (start - low) // 2
+        if index >= size:
+            continue
+        
+        if period is None:
+            candidates[index::p] = bytes(len(range(index, size, p)))
+            continue
+        
+        # Cross off every odd multiple of p except the allowed progression
+        allowed = p + max(0, -(-(low - p) // period)) * period
+        allowed_index, allowed_step = (allowed - low) // 2, period // 2
+        kept = candidates[allowed_index::allowed_step]
+        candidates[index::p] = bytes(len(range(index, size, p)))
+        candidates[allowed_index::allowed_step] = kept
+    
+    return candidates
+
+
+def fermat_pseudoprimes_between(lo, hi, base=2, segment_size=SEGMENT_SIZE):
+    """
+    Yield the odd Fermat pseudoprimes to the given base in [lo, hi).
+    
+    Args:
+        lo (int): Lower bound of the window (inclusive)
+        hi (int): Upper bound of the window (exclusive)
+        base (int): Fermat base (at least 2)
+        segment_size (int): Number of odd integers sieved per segment
+    
+    Yields:
+        int: Next odd composite n with base^(n-1) ≡ 1 (mod n)
+    """
+    base_primes = _small_primes(isqrt(max(hi - 1, 0)))[1:]
+    low = max(lo, 3) | 1
+    
+    while low < hi:
+        high = min(low + 2 * segment_size, hi)
+        with stats.phase("sieve"):
+            candidates = list(compress(range(low, high, 2), _fermat_candidates(low, high, base, base_primes)))
+        with stats.phase("fermat test"):
+            found = [n for n in candidates if powmod(base, n - 1, n) == 1]
+        if stats.ENABLED:
+            stats.count("candidates", len(candidates))
+            for n in candidates:
+                stats.count_modexp(n - 1, n)
+        yield from found
+        low = high
+
+
+def _fermat_chunk(base, lo, hi):
+    """
+    List the pseudoprimes of one chunk; runs inside pool workers.
+    
+    Args:
+        base (int): Fermat base
+        lo (int): Lower bound of the chunk (inclusive)
+        hi (int): Upper bound of the chunk (exclusive)
+    
+    Returns:
+        list: Pseudoprimes in [lo, hi)
+    """
+    return list(fermat_pseudoprimes_between(lo, hi, base))
+
+
+def find_fermat_pseudoprimes(max_n, base=2, max_workers=1,
+                             chunk_size=FERMAT_CHUNK_SIZE, checkpoint=None, resume=False):
+    """
+    Find all odd Fermat pseudoprimes to the given base up to max_n.
+    
+    The range is split into chunks by parallel_range_map, scanned in order
+    or spread over a process pool when max_workers is not 1. If checkpoint
+    is given, the end of the last completed chunk and the pseudoprimes found
+    so far are saved there every few seconds.
+    
+    Args:
+        max_n (int): Maximum value to check
+        base (int): Fermat base (at least 2)
+        max_workers (int): Number of worker processes (None for all cores)
+        chunk_size (int): Largest number of integers per chunk
+        checkpoint (str): Path of the progress file, or None
+        resume (bool): If True, continue from the checkpoint when it exists
+    
+    Returns:
+        list: List of all odd pseudoprimes to the base <= max_n
+    """
+    scan = {"kind": "fermat_pseudoprimes", "max_n": max_n, "base": base}
+    start, found = 3, []
+    
+    state = load_checkpoint(checkpoint, scan) if resume and checkpoint is not None else None
+    if state is not None:
+        start, found = state["next"], state["found"]
+    
+    save = checkpoint_writer(checkpoint, scan)
+    progress = {"next": start, "found": found}
+    chunks = parallel_range_map(partial(_fermat_chunk, base), start, max_n + 1, max_workers,
+                                min_chunk=2 * SEGMENT_SIZE, max_chunk=chunk_size)
+    try:
+        for _, hi, chunk_found in chunks:
+            found.extend(chunk_found)
+            progress["next"] = hi
+            save(progress)
+    finally:
+        save(progress, force=True)
+    
+    return found
+
+
+def classify_pseudoprime(n, bases=(2,), factors=None):
+    """
+    Classify an odd composite n against several pseudoprime definitions.
+    
+    For each base one ladder a^d, a^(2d), ..., a^(n-1) (mod n), with
+    n - 1 = d * 2^s, answers the Fermat, strong and Euler-Jacobi tests at
+    once. n is only factored when it passes the Fermat test for every base
+    coprime to it, since otherwise it cannot be a Carmichael number.
+    
+    Args:
+        n (int): Odd composite number
+        bases (tuple): Bases to test (each at least 2)
+        factors (dict): Known {prime: exponent} factorization of n, or None
+        
+    Returns:
+        dict: {"n": n, "fermat": bases, "strong": bases, "euler_jacobi":
+        bases, "carmichael": bool}, where each list holds the bases to which
+        n is a pseudoprime of that kind
+    """
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    fermat, strong, euler_jacobi = [], [], []
+    for a in bases:
+        ladder = [powmod(a, d, n)]
+        for _ in range(s):
+            ladder.append(ladder[-1] * ladder[-1] % n)
+        
+        if ladder[s] == 1:
+            fermat.append(a)
+        if ladder[0] == 1 or n - 1 in ladder[:s]:
+            strong.append(a)
+        symbol = _jacobi_symbol(a, n)
+        if symbol != 0 and ladder[s - 1] == symbol % n:
+            euler_jacobi.append(a)
+    
+    carmichael = False
+    if all(a in fermat for a in bases if gcd(a, n) == 1):
+        if factors is None:
+            factors = factorint(n)
+        # Korselt's criterion
+        carmichael = (
+            len(factors) > 1
+            and all(exponent == 1 for exponent in factors.values())
+            and all((n - 1) % (p - 1) == 0 for p in factors)
+        )
+    
+    return {
+        "n": n,
+        "fermat": fermat,
+        "strong": strong,
+        "euler_jacobi": euler_jacobi,
+        "carmichael": carmichael,
+    }
+
+
+def classify_pseudoprimes_between(lo, hi, bases=(2,), spf_table=None,
+                                  segment_size=SEGMENT_SIZE):
+    """
+    Classify every odd composite in [lo, hi) in a single pass.
+    
+    Primes are skipped with the segmented sieve. Factorizations come from
+    spf_table when n is inside it, and from factorint otherwise.
+    
+    Args:
+        lo (int): Lower bound of the window (inclusive)
+        hi (int): Upper bound of the window (exclusive)
+        bases (tuple): Bases to test (each at least 2)
+        spf_table (array): Optional table from build_spf_table
+        segment_size (int): Number of odd integers sieved per segment
+        
+    Yields:
+        dict: Result of classify_pseudoprime for each n that is a
+        pseudoprime of some kind to some base, or a Carmichael number
+    """
+    base_primes = _small_primes(isqrt(max(hi - 1, 0)))[1:]
+    table_size = len(spf_table) if spf_table is not None else 0
+    low = max(lo, 3) | 1
+    
+    while low < hi:
+        high = min(low + 2 * segment_size, hi)
+        composites = sieve_segment(low, high, base_primes).translate(_INVERT)
+        
+        for n in compress(range(low, high, 2), composites):
+            factors = None
+            if n < table_size:
+                factors = {}
+                for p in spf_factorize(n, spf_table):
+                    factors[p] = factors.get(p, 0) + 1
+            
+            record = classify_pseudoprime(n, bases, factors)
+            if (record["fermat"] or record["strong"] or record["euler_jacobi"]
+                    or record["carmichael"]):
+                yield record
+        low = high
@@ -0,0 +1,286 @@
+"""
+Prime sieves: a segmented odd-only sieve over arbitrary windows and the
+process-wide prime table built on top of it.
+"""
+
+from bisect import bisect_right
+from itertools import compress
+from math import isqrt
+
+from . import stats
+
+
+SEGMENT_SIZE = 1 << 18  # odd numbers per segment (256 KiB, roughly one L2 cache)
+
+# Residues modulo 30 prime to 2, 3 and 5: the eight bits of a wheel byte
+WHEEL_RESIDUES = (1, 7, 11, 13, 17, 19, 23, 29)
+WHEEL_INDEX = {r: i for i, r in enumerate(WHEEL_RESIDUES)}
+
+
+def _small_primes(limit):
+    """
+    Generate all primes <= limit with a compact odd-only sieve.
+    
+    Index i of the bytearray stands for the odd number 2i + 1, so the table
+    uses one byte per two integers. Only meant for small bounds such as
+    sqrt(n) when seeding the segmented sieve.
+    
+    Args:
+        limit (int): Upper bound for prime generation
+        
+    Returns:
+        list: List of all prime numbers <= limit
+    """
+    if limit < 2:
+        return []
+    
+    sieve = bytearray([1]) * ((limit + 1) // 2)
+    sieve[0] = 0  # 1 is not prime
+    
+    for i in range(1, (isqrt(limit) - 1) // 2 + 1):
+        if sieve[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            sieve[start::p] = bytes(len(range(start, len(sieve), p)))
+    
+    return [2] + list(compress(range(1, limit + 1, 2), sieve))
+
+
+def sieve_segment(low, high, base_primes):
+    """
+    Sieve the odd numbers in [low, high) against the given base primes.
+    
+    Args:
+        low (int): Odd lower bound of the segment (inclusive, at least 3)
+        high (int): Upper bound of the segment (exclusive)
+        base_primes (list): Odd primes up to at least sqrt(high - 1)
+        
+    Returns:
+        bytearray: Byte i is 1 if low + 2i is prime, 0 otherwise
+    """
+    if stats.ENABLED:
+        stats.count("sieve_segments")
+    size = (high - low + 1) // 2
+    segment = bytearray([1]) * size
+    
+    for p in base_primes:
+        if p * p >= high:
+            break
+        # First odd multiple of p inside the segment, never below p²
+        start = max(p * p, (low + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        index = (start - low) // 2
+        if index < size:
+            segment[index::p] = bytes(len(range(index, size, p)))
+    
+    return segment
+
+
+def wheel_segment(k_lo, k_hi, base_primes):
+    """
+    Sieve the numbers 30k + r (k_lo <= k < k_hi, r in WHEEL_RESIDUES).
+    
+    Each of the eight residue classes is sieved as its own bytearray, one
+    byte per k: the multiples p * (30t + r_j) of a base prime p that land in
+    one class are exactly every p-th k, so each prime costs eight slice
+    assignments per segment. The classes are then packed so that bit i of
+    byte k - k_lo says whether 30k + WHEEL_RESIDUES[i] is prime.
+    
+    Args:
+        k_lo (int): First wheel index (inclusive)
+        k_hi (int): Last wheel index (exclusive)
+        base_primes (list): Primes from 7 up to at least sqrt(30 * k_hi)
+        
+    Returns:
+        bytes: k_hi - k_lo wheel bytes
+    """
+    if stats.ENABLED:
+        stats.count("sieve_segments")
+    size = k_hi - k_lo
+    classes = [bytearray([1]) * size for _ in WHEEL_RESIDUES]
+    
+    for p in base_primes:
+        if p * p >= 30 * k_hi:
+            break
+        for r in WHEEL_RESIDUES:
+            offset = p * r // 30  # k of p * (30t + r) is p * t + offset
+            t = max(-(-(p - r) // 30), -(-(k_lo - offset) // p))  # from p² and from k_lo
+            index = p * t + offset - k_lo
+            if index < size:
+                target = classes[WHEEL_INDEX[p * r % 30]]
+                target[index::p] = bytes(len(range(index, size, p)))
+    
+    if k_lo == 0:
+        classes[0][0] = 0  # 1 is not prime
+    
+    packed = 0
+    for i, flags in enumerate(classes):
+        packed |= int.from_bytes(flags, "little") << i
+    return packed.to_bytes(size, "little")
+
+
+def primes_between(lo, hi, segment_size=SEGMENT_SIZE):
+    """
+    Yield all prime numbers p with lo <= p < hi, in increasing order.
+    
+    Only odd numbers are stored, one byte each, and the window is processed
+    one cache-sized segment at a time. Memory stays bounded by the base
+    primes up to sqrt(hi) plus a single segment, wherever the window starts.
+    
+    Args:
+        lo (int): Lower bound of the window (inclusive)
+        hi (int): Upper bound of the window (exclusive)
+        segment_size (int): Number of odd integers sieved per segment
+        
+    Yields:
+        int: Next prime number in [lo, hi)
+    """
+    if hi <= 2 or lo >= hi:
+        return
+    if lo <= 2:
+        yield 2
+    
+    base_primes = _small_primes(isqrt(hi - 1))[1:]  # odd base primes only
+    low = max(lo, 3) | 1  # first odd number in the window
+    
+    while low < hi:
+        high = min(low + 2 * segment_size, hi)  # exclusive
+        yield from compress(range(low, high, 2), sieve_segment(low, high, base_primes))
+        low = high
+
+
+def iter_primes(start=2, segment_size=SEGMENT_SIZE):
+    """
+    Yield prime numbers >= start indefinitely, in increasing order.
+    
+    The primes are produced by primes_between over consecutive windows
+    whose width doubles each time, so the base primes are re-sieved only
+    a logarithmic number of times.
+    
+    Args:
+        start (int): Smallest value to consider
+        segment_size (int): Number of odd integers sieved per segment
+        
+    Yields:
+        int: Next prime number >= start
+    """
+    low = start
+    width = 2 * segment_size
+    
+    while True:
+        yield from primes_between(low, low + width, segment_size)
+        low += width
+        width *= 2
+
+
+def segmented_sieve(n, segment_size=SEGMENT_SIZE):
+    """
+    Yield all prime numbers less than or equal to n, in increasing order.
+    
+    Args:
+        n (int): Upper bound for prime generation
+        segment_size (int): Number of odd integers sieved per segment
+        
+    Returns:
+        iterator: Lazy iterator over all prime numbers <= n
+    """
+    return primes_between(2, n + 1, segment_size)
+
+
+def sieve_of_eratosthenes(n):
+    """
+    Generate all prime numbers less than or equal to n using Sieve of Eratosthenes.
+    
+    The work is delegated to segmented_sieve, so no (n + 1)-sized table is
+    ever allocated.
+    
+    Args:
+        n (int): Upper bound for prime generation
+        
+    Returns:
+        list: List of all prime numbers <= n
+    """
+    return list(segmented_sieve(n))
+
+
+# Process-wide prime table shared by every caller; grown on demand
+_prime_table = []
+_prime_table_limit = 1
+
+
+def prime_table(limit):
+    """
+    Return the shared table of primes, extended to cover at least limit.
+    
+    The table lives for the whole process, so a sieve computed for one entry
+    point is reused by every later caller. It only ever grows (at least
+    doubling each time), and may reach beyond limit. Callers must not
+    modify the returned list.
+    
+    Args:
+        limit (int): Smallest upper bound the table must cover
+        
+    Returns:
+        list: Shared list of all primes <= the current table limit
+    """
+    global _prime_table_limit
+    
+    if limit > _prime_table_limit:
+        new_limit = max(limit, 2 * _prime_table_limit)
+        _prime_table.extend(primes_between(_prime_table_limit + 1, new_limit + 1))
+        _prime_table_limit = new_limit
+    return _prime_table
+
+
+def primes_up_to(n):
+    """
+    List all primes <= n, served from the shared prime table.
+    
+    Args:
+        n (int): Upper bound for prime listing
+        
+    Returns:
+        list: New list of all prime numbers <= n
+    """
+    table = prime_table(n)
+    return table[:bisect_right(table, n)]
+
+
+# Process-wide primality flags of the small odd numbers; built on first use
+SMALL_FLAGS_LIMIT = 1 << 20  # numbers covered by small_prime_flags
+_small_flags = None
+
+
+def small_prime_flags():
+    """
+    Return the shared primality flags of the odd numbers below SMALL_FLAGS_LIMIT.
+    
+    The result cache and the batch tests answer small numbers from this one
+    bitmap. Callers must not modify it.
+    
+    Returns:
+        bytearray: Byte i is 1 if 2i + 1 is prime
+    """
+    global _small_flags
+    
+    if _small_flags is None:
+        flags = sieve_segment(1, SMALL_FLAGS_LIMIT, _small_primes(isqrt(SMALL_FLAGS_LIMIT))[1:])
+        flags[0] = 0  # 1 is not prime
+        _small_flags = flags
+    return _small_flags
+
+
+def _is_small_prime(n):
+    """
+    Decide primality of a number below SMALL_FLAGS_LIMIT from the shared flags.
+    
+    Args:
+        n (int): Number below SMALL_FLAGS_LIMIT
+    
+    Returns:
+        bool: True if n is prime
+    """
+    if n % 2 == 0:
+        return n == 2
+    return n > 0 and small_prime_flags()[n // 2] == 1
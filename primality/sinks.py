@@ -0,0 +1,233 @@
+"""
+Streaming result sinks: write generator output to CSV, JSONL or Parquet.
+
+Records are pulled from the generator RESULT_BATCH_SIZE at a time and each
+batch is written with a single call, so memory stays constant however many
+results there are. A record can be a plain value (a prime), a tuple (such
+as a check_mersenne_primes row) or a dict (such as a classify_pseudoprime
+record). pyarrow is optional; it is only imported when a Parquet file is
+written, so importing the package never pays for it.
+"""
+
+import csv
+import json
+import os
+from itertools import chain, islice
+
+RESULT_BATCH_SIZE = 1 << 16  # records written per batch
+FILE_BUFFER_SIZE = 1 << 20  # bytes buffered by text sinks
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _batches(records, batch_size):
+    """
+    Split an iterable into lists of at most batch_size items.
+    
+    Args:
+        records (iterable): Records to split
+        batch_size (int): Largest batch
+    
+    Yields:
+        list: Next non-empty batch
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _to_rows(batch, kind, fields):
+    """
+    Turn a batch of records into row tuples.
+    
+    Args:
+        batch (list): Records of one kind
+        kind (str): "dict", "tuple" or "value"
+        fields (tuple): Column names (the keys read from dict records)
+    
+    Returns:
+        list: List of row tuples
+    """
+    if kind == "dict":
+        return [tuple(record[key] for key in fields) for record in batch]
+    if kind == "tuple":
+        return batch
+    return [(value,) for value in batch]
+
+
+def _plain(value):
+    """
+    Convert a list or tuple field to JSON text for flat (CSV/Parquet) output.
+    
+    Args:
+        value: Field value
+    
+    Returns:
+        Field value, with lists and tuples serialized as JSON
+    """
+    if isinstance(value, (list, tuple)):
+        return json.dumps(value)
+    return value
+
+
+def _write_csv(batches, path, fields):
+    """
+    Write batches of rows as CSV with a header line.
+    
+    Args:
+        batches (iterator): Lists of row tuples
+        path (str): Destination file
+        fields (tuple): Column names
+    
+    Returns:
+        int: Number of rows written
+    """
+    count = 0
+    with open(path, "w", newline="", buffering=FILE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        for rows in batches:
+            writer.writerows([tuple(map(_plain, row)) for row in rows])
+            count += len(rows)
+    return count
+
+
+def _write_jsonl(batches, path, fields):
+    """
+    Write batches of rows as JSON Lines, one object per row.
+    
+    Args:
+        batches (iterator): Lists of row tuples
+        path (str): Destination file
+        fields (tuple): Object keys
+    
+    Returns:
+        int: Number of rows written
+    """
+    count = 0
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    with open(path, "w", buffering=FILE_BUFFER_SIZE) as f:
+        for rows in batches:
+            f.write("\n".join([encode(dict(zip(fields, row))) for row in rows]))
+            f.write("\n")
+            count += len(rows)
+    return count
+
+
+def _arrow_type(pa, column):
+    """
+    Pick the Parquet column type from the first batch of a column.
+    
+    Integers that do not fit in an int64 (Mersenne numbers, large primes)
+    are stored as decimal strings.
+    
+    Args:
+        pa (module): The pyarrow module
+        column (list): Values of one column
+    
+    Returns:
+        pyarrow.DataType: Column type
+    """
+    if all(isinstance(value, bool) for value in column):
+        return pa.bool_()
+    if all(isinstance(value, int) and INT64_MIN <= value <= INT64_MAX for value in column):
+        return pa.int64()
+    if all(isinstance(value, float) or isinstance(value, int) and INT64_MIN <= value <= INT64_MAX
+           for value in column):
+        return pa.float64()
+    return pa.string()
+
+
+def _write_parquet(batches, path, fields):
+    """
+    Write batches of rows as one Parquet row group per batch.
+    
+    The schema is fixed by the first batch.
+    
+    Args:
+        batches (iterator): Lists of row tuples
+        path (str): Destination file
+        fields (tuple): Column names
+    
+    Returns:
+        int: Number of rows written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:  # pyarrow is optional
+        raise ImportError("Parquet output needs pyarrow (pip install pyarrow)") from None
+    
+    count = 0
+    writer = None
+    try:
+        for rows in batches:
+            columns = [list(column) for column in zip(*rows)]
+            if writer is None:
+                schema = pa.schema([(name, _arrow_type(pa, column))
+                                    for name, column in zip(fields, columns)])
+                writer = pq.ParquetWriter(path, schema)
+            arrays = []
+            for column, field in zip(columns, schema):
+                if field.type == pa.string():
+                    column = [None if value is None else str(_plain(value)) for value in column]
+                arrays.append(pa.array(column, type=field.type))
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            count += len(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+# Sink writers by format name; each takes (batches, path, fields)
+SINK_WRITERS = {
+    "csv": _write_csv,
+    "jsonl": _write_jsonl,
+    "parquet": _write_parquet,
+}
+
+
+def write_results(records, path, fields=None, file_format=None, batch_size=RESULT_BATCH_SIZE):
+    """
+    Stream records from any iterable into a result file.
+    
+    Column names come from the keys of the first dict record, or from
+    fields for plain values and tuples ("value" or column_0, column_1, ...
+    when omitted).
+    
+    Args:
+        records (iterable): Plain values, tuples or dicts (all of one kind)
+        path (str): Destination file
+        fields (tuple): Column names, or None
+        file_format (str): A key of SINK_WRITERS (None picks it from the file
+            extension)
+        batch_size (int): Number of records written per batch
+    
+    Returns:
+        int: Number of records written
+    """
+    if file_format is None:
+        file_format = os.path.splitext(path)[1].lstrip(".").lower()
+    if file_format not in SINK_WRITERS:
+        raise ValueError(f"unknown result format {file_format!r}; expected one of {sorted(SINK_WRITERS)}")
+    
+    batches = _batches(records, batch_size)
+    first = next(batches, [])
+    sample = first[0] if first else None
+    
+    if isinstance(sample, dict):
+        kind = "dict"
+        fields = tuple(sample) if fields is None else tuple(fields)
+    elif isinstance(sample, tuple):
+        kind = "tuple"
+        fields = tuple(f"column_{i}" for i in range(len(sample))) if fields is None else tuple(fields)
+    else:
+        kind = "value"
+        fields = ("value",) if fields is None else tuple(fields)
+    
+    rows = (_to_rows(batch, kind, fields) for batch in chain([first] if first else [], batches))
+    return SINK_WRITERS[file_format](rows, path, fields)
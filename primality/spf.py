@@ -0,0 +1,90 @@
+"""
+Smallest-prime-factor (SPF) tables for factoring every n <= N in O(log n).
+
+The table is a compact array('I') (4 bytes per entry) and can be saved to a
+file and memory-mapped back, so later runs start without rebuilding it.
+"""
+
+import mmap
+from array import array
+from math import isqrt
+
+from .sieve import primes_up_to
+
+SPF_MAX = (1 << 32) - 1  # largest bound an array('I') entry can hold
+
+
+def build_spf_table(n):
+    """
+    Build the smallest-prime-factor table for every integer 0 <= i <= n.
+    
+    Each entry starts as i itself; then, for the primes p <= sqrt(n) in
+    decreasing order, every multiple from p² onwards is overwritten with p,
+    so the smallest prime factor is written last. The crossing off is done
+    with slice assignments, which keeps the whole build in C.
+    
+    Args:
+        n (int): Upper bound of the table (at most 2^32 - 1)
+    
+    Returns:
+        array: array('I') of length n + 1 with table[i] the smallest prime
+        factor of i for i >= 2
+    """
+    if not 0 <= n <= SPF_MAX:
+        raise ValueError(f"n must be between 0 and {SPF_MAX}")
+    
+    table = array("I", range(n + 1))
+    for p in reversed(primes_up_to(isqrt(n))):
+        table[p * p::p] = array("I", [p]) * len(range(p * p, n + 1, p))
+    return table
+
+
+def spf_factorize(n, table):
+    """
+    Find prime factorization of n by repeatedly dividing out table[n].
+    
+    Args:
+        n (int): Number to factorize (1 <= n < len(table))
+        table (array): Table from build_spf_table or load_spf_table
+    
+    Returns:
+        list: List of prime factors in non-decreasing order
+    """
+    factors = []
+    
+    while n > 1:
+        p = table[n]
+        factors.append(p)
+        n //= p
+    
+    return factors
+
+
+def save_spf_table(table, path):
+    """
+    Write an SPF table to disk as raw native-endian 32-bit integers.
+    
+    Args:
+        table (array): Table from build_spf_table
+        path (str): Destination file
+    """
+    with open(path, "wb") as f:
+        table.tofile(f)
+
+
+def load_spf_table(path):
+    """
+    Memory-map an SPF table written by save_spf_table.
+    
+    Nothing is read up front; pages are loaded by the OS when first touched,
+    and processes mapping the same file share them.
+    
+    Args:
+        path (str): File written by save_spf_table
+    
+    Returns:
+        memoryview: Read-only view of unsigned 32-bit entries
+    """
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapping).cast("I")
@@ -0,0 +1,180 @@
+"""
+Off-by-default instrumentation for the primality and sieve hot paths.
+
+Instrumented code checks the module flag ENABLED before doing anything, so
+when instrumentation is off the cost is one global lookup per call site.
+When it is on, counters and per-phase wall times are collected:
+    
+    candidates         candidates handed to a primality test
+    miller_rabin_rounds  strong probable prime rounds (one modexp each)
+    modexp_calls       modular exponentiations
+    modexp_bit_ops     their schoolbook cost: exponent bits * modulus bits²
+    sieve_segments     sieve segments processed
+
+Only work done in the current process is counted; process pool workers
+keep their own counters. Setting the environment variable PRIMALITY_STATS
+enables instrumentation at import time, and PRIMALITY_PROGRESS=<seconds>
+also prints a progress line to stderr at that interval.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+ENABLED = False
+
+_counters = {}
+_phase_seconds = {}
+_started = None
+_progress_stop = None
+_NO_PHASE = nullcontext()
+
+
+def count(name, amount=1):
+    """
+    Add amount to a counter. Callers check ENABLED first.
+    
+    Args:
+        name (str): Counter name
+        amount (int): Increment
+    """
+    _counters[name] = _counters.get(name, 0) + amount
+
+
+def count_modexp(exponent, modulus):
+    """
+    Record one modular exponentiation. Callers check ENABLED first.
+    
+    Args:
+        exponent (int): Exponent
+        modulus (int): Modulus
+    """
+    bits = modulus.bit_length()
+    _counters["modexp_calls"] = _counters.get("modexp_calls", 0) + 1
+    _counters["modexp_bit_ops"] = _counters.get("modexp_bit_ops", 0) + exponent.bit_length() * bits * bits
+
+
+@contextmanager
+def _timed_phase(name):
+    """
+    Add the wall time spent inside the block to a phase.
+    
+    Args:
+        name (str): Phase name
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phase_seconds[name] = _phase_seconds.get(name, 0.0) + time.perf_counter() - start
+
+
+def phase(name):
+    """
+    Time a block of code as part of a named phase.
+    
+    Use as "with stats.phase('sieve'): ...". When instrumentation is off a
+    shared no-op context manager is returned.
+    
+    Args:
+        name (str): Phase name
+    
+    Returns:
+        context manager: Timer for the block
+    """
+    if not ENABLED:
+        return _NO_PHASE
+    return _timed_phase(name)
+
+
+def get_stats():
+    """
+    Return a snapshot of the collected statistics.
+    
+    Returns:
+        dict: {"enabled": bool, "elapsed": seconds since enable() (or
+        None), "counters": {name: int}, "phases": {name: seconds}}
+    """
+    return {
+        "enabled": ENABLED,
+        "elapsed": None if _started is None else time.perf_counter() - _started,
+        "counters": dict(_counters),
+        "phases": dict(_phase_seconds),
+    }
+
+
+def format_stats(stats=None):
+    """
+    Format statistics as a single progress line.
+    
+    Args:
+        stats (dict): Snapshot from get_stats (None takes a new one)
+    
+    Returns:
+        str: Line such as "[12.0s] candidates=1204 ... | sieve 3.1s"
+    """
+    if stats is None:
+        stats = get_stats()
+    elapsed = stats["elapsed"] or 0.0
+    counters = " ".join(f"{name}={value}" for name, value in sorted(stats["counters"].items()))
+    phases = " ".join(f"{name} {seconds:.1f}s" for name, seconds in sorted(stats["phases"].items()))
+    return f"[{elapsed:.1f}s] {counters}" + (f" | {phases}" if phases else "")
+
+
+def _progress_loop(interval, stream, stop):
+    """
+    Print a progress line every interval seconds until stop is set.
+    
+    Args:
+        interval (float): Seconds between lines
+        stream (file): Output stream
+        stop (threading.Event): Set to end the loop
+    """
+    while not stop.wait(interval):
+        print(format_stats(), file=stream, flush=True)
+
+
+def reset():
+    """Clear every counter and phase time."""
+    global _started
+    
+    _counters.clear()
+    _phase_seconds.clear()
+    _started = time.perf_counter()
+
+
+def enable(progress_interval=None, stream=sys.stderr):
+    """
+    Turn instrumentation on, clearing earlier statistics.
+    
+    Args:
+        progress_interval (float): Seconds between progress lines, or None
+            for no progress output
+        stream (file): Where progress lines are printed
+    """
+    global ENABLED, _progress_stop
+    
+    disable()
+    reset()
+    ENABLED = True
+    if progress_interval:
+        _progress_stop = threading.Event()
+        threading.Thread(
+            target=_progress_loop, args=(progress_interval, stream, _progress_stop), daemon=True,
+        ).start()
+
+
+def disable():
+    """Turn instrumentation off; the collected statistics are kept."""
+    global ENABLED, _progress_stop
+    
+    ENABLED = False
+    if _progress_stop is not None:
+        _progress_stop.set()
+        _progress_stop = None
+
+
+if os.environ.get("PRIMALITY_STATS") or os.environ.get("PRIMALITY_PROGRESS"):
+    enable(float(os.environ.get("PRIMALITY_PROGRESS") or 0) or None)
@@ -0,0 +1,306 @@
+"""
+Persistent prime store: an odd-only bitset of the primes up to a limit,
+built once from the segmented sieve and memory-mapped on later runs.
+
+Bit i of the bitset stands for the odd number 2i + 1, so 10^10 takes about
+625 MB. After every STORE_BLOCK_BYTES bytes the running prime count is
+saved as a checkpoint, so prime_count, nth_prime and next_prime only touch
+one block. The file is opened read-only; processes that load the same
+file share its pages through the OS page cache instead of copying them.
+
+File layout (native byte order): a 32-byte header (magic, limit, number of
+bitset bytes, number of blocks), the bitset, then one unsigned 64-bit
+checkpoint per block boundary.
+"""
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from itertools import compress
+from math import isqrt
+
+from .backend import next_prime as _next_prime_unbounded
+from .counting import count_primes
+from .sieve import SEGMENT_SIZE, _small_primes, sieve_segment
+
+STORE_MAGIC = b"PRIMEST1"
+STORE_HEADER = struct.Struct("=8sQQQ")  # magic, limit, bitset bytes, blocks
+STORE_BLOCK_BYTES = 4096  # bitset bytes (32768 odd numbers) per checkpoint
+
+# Number of set bits in every byte value, and the positions of those bits
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+_SET_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _pack_bits(flags):
+    """
+    Pack a 0/1 bytearray into a bitset, bit k of byte j holding flags[8j + k].
+    
+    The eight strided slices are OR-ed together as big integers, so the
+    packing runs in C rather than one byte at a time.
+    
+    Args:
+        flags (bytearray): Bytes equal to 0 or 1, length a multiple of 8
+    
+    Returns:
+        bytes: Packed bitset of len(flags) // 8 bytes
+    """
+    packed = 0
+    for k in range(8):
+        packed |= int.from_bytes(flags[k::8], "little") << k
+    return packed.to_bytes(len(flags) // 8, "little")
+
+
+def _unpack_bits(packed):
+    """
+    Expand a bitset into a 0/1 bytearray, the inverse of _pack_bits.
+    
+    Args:
+        packed (bytes): Bitset
+    
+    Returns:
+        bytearray: Byte 8j + k is bit k of packed[j]
+    """
+    value = int.from_bytes(packed, "little")
+    ones = int.from_bytes(b"\x01" * len(packed), "little")
+    flags = bytearray(8 * len(packed))
+    for k in range(8):
+        flags[k::8] = (value >> k & ones).to_bytes(len(packed), "little")
+    return flags
+
+
+def build_prime_store(path, limit):
+    """
+    Sieve the primes up to limit and write them to a prime store file.
+    
+    The segmented sieve output is packed and written one segment at a
+    time, so memory stays bounded by one segment and the checkpoints.
+    
+    Args:
+        path (str): Destination file
+        limit (int): Largest number covered by the store (at least 2)
+    
+    Returns:
+        int: Number of primes <= limit
+    """
+    if limit < 2:
+        raise ValueError("limit must be at least 2")
+    
+    bit_count = (limit + 1) // 2  # odd numbers 1, 3, ..., <= limit
+    byte_count = -(-bit_count // 8)
+    block_count = -(-byte_count // STORE_BLOCK_BYTES)
+    base_primes = _small_primes(isqrt(limit))[1:]
+    counts = array("Q", [0])
+    total = 0
+    
+    with open(path, "wb") as f:
+        f.write(STORE_HEADER.pack(STORE_MAGIC, limit, byte_count, block_count))
+        
+        low = 1
+        while low <= limit:
+            high = min(low + 2 * SEGMENT_SIZE, limit + 1)
+            flags = sieve_segment(low, high, base_primes)
+            if low == 1:
+                flags[0] = 0  # 1 is not prime
+            flags.extend(bytes(-len(flags) % (8 * STORE_BLOCK_BYTES)))
+            packed = _pack_bits(flags)[:byte_count - f.tell() + STORE_HEADER.size]
+            
+            for start in range(0, len(packed), STORE_BLOCK_BYTES):
+                total += int.from_bytes(packed[start:start + STORE_BLOCK_BYTES], "little").bit_count()
+                counts.append(total)
+            f.write(packed)
+            low = high
+        
+        counts.tofile(f)
+    
+    return total + 1  # the bitset leaves out 2
+
+
+def load_prime_store(path):
+    """
+    Memory-map a prime store written by build_prime_store.
+    
+    Nothing is read up front except the header.
+    
+    Args:
+        path (str): File written by build_prime_store
+    
+    Returns:
+        tuple: (limit, bits, counts) where bits is a read-only memoryview
+        of the bitset and counts a memoryview of the unsigned 64-bit block
+        checkpoints (counts[b] odd primes lie before block b)
+    """
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    magic, limit, byte_count, block_count = STORE_HEADER.unpack_from(mapping)
+    if magic != STORE_MAGIC:
+        raise ValueError(f"{path!r} is not a prime store")
+    
+    view = memoryview(mapping)
+    bits_start = STORE_HEADER.size
+    counts_start = bits_start + byte_count
+    bits = view[bits_start:counts_start]
+    counts = view[counts_start:counts_start + 8 * (block_count + 1)].cast("Q")
+    return limit, bits, counts
+
+
+def prime_count(x, store=None):
+    """
+    Count the primes <= x (the prime-counting function π(x)).
+    
+    Inside the store this is a checkpoint plus one partial popcount; beyond
+    it (or without a store) the count comes from count_primes.
+    
+    Args:
+        x (int): Upper bound
+        store (tuple): Store from load_prime_store, or None
+    
+    Returns:
+        int: Number of primes p <= x
+    """
+    if x < 2:
+        return 0
+    if store is None or x > store[0]:
+        return count_primes(x)
+    
+    limit, bits, counts = store
+    
+    i = (x - 1) // 2  # bit of the largest odd number <= x
+    byte, bit = divmod(i, 8)
+    block_start = byte - byte % STORE_BLOCK_BYTES
+    count = counts[block_start // STORE_BLOCK_BYTES]
+    count += int.from_bytes(bits[block_start:byte], "little").bit_count()
+    count += _POPCOUNT[bits[byte] & ((2 << bit) - 1)]
+    return count + 1  # 2
+
+
+def _select_bit(bits, counts, block_bytes, target, byte_decoder):
+    """
+    Find the target-th set bit of a bitmap with per-block rank checkpoints.
+    
+    The checkpoint picks the block; the scan then skips 64-byte chunks,
+    then single bytes, and decodes the bit inside the last byte.
+    
+    Args:
+        bits (bytes-like): Bitmap
+        counts (array): counts[b] is the number of set bits before block b
+        block_bytes (int): Bytes per block
+        target (int): Rank of the bit, from 1 to counts[-1]
+        byte_decoder (list): For every byte value, the tuple of values its
+            set bits stand for, in bit order
+    
+    Returns:
+        tuple: (position, value), the byte holding the bit and the value
+        byte_decoder gives for it
+    """
+    block = bisect_left(counts, target) - 1
+    remaining = target - counts[block]
+    position = block * block_bytes
+    
+    while True:
+        chunk = int.from_bytes(bits[position:position + 64], "little").bit_count()
+        if chunk >= remaining:
+            break
+        remaining -= chunk
+        position += 64
+    while _POPCOUNT[bits[position]] < remaining:
+        remaining -= _POPCOUNT[bits[position]]
+        position += 1
+    return position, byte_decoder[bits[position]][remaining - 1]
+
+
+def nth_prime(k, store):
+    """
+    Find the k-th prime (nth_prime(1) == 2).
+    
+    Args:
+        k (int): Index of the prime, at least 1
+        store (tuple): Store from load_prime_store
+    
+    Returns:
+        int: The k-th prime
+    """
+    _, bits, counts = store
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    if k == 1:
+        return 2
+    
+    target = k - 1  # rank among the odd primes
+    if target > counts[-1]:
+        raise ValueError(f"the store only holds {counts[-1] + 1} primes")
+    
+    position, bit = _select_bit(bits, counts, STORE_BLOCK_BYTES, target, _SET_BITS)
+    return 2 * (8 * position + bit) + 1
+
+
+def next_prime(x, store=None):
+    """
+    Find the smallest prime greater than x.
+    
+    Inside the store this is a scan for the next set bit; beyond it (or
+    without a store) the answer comes from the primality tests.
+    
+    Args:
+        x (int): Starting point
+        store (tuple): Store from load_prime_store, or None
+    
+    Returns:
+        int: Smallest prime p > x
+    """
+    if x < 2:
+        return 2
+    if store is None:
+        return _next_prime_unbounded(x)
+    
+    limit, bits, _ = store
+    i = x // 2 if x % 2 == 0 else (x + 1) // 2  # bit of the first odd number > x
+    byte, bit = divmod(i, 8)
+    
+    if byte < len(bits):
+        value = bits[byte] >> bit << bit
+        while not value:
+            byte += 1
+            if byte == len(bits):
+                break
+            value = bits[byte]
+        if value:
+            prime = 2 * (8 * byte + (value & -value).bit_length() - 1) + 1
+            if prime <= limit:
+                return prime
+    
+    return _next_prime_unbounded(max(x, limit))
+
+
+def store_primes_between(store, lo, hi):
+    """
+    Yield the primes p with lo <= p < hi from the store, in increasing order.
+    
+    Args:
+        store (tuple): Store from load_prime_store
+        lo (int): Lower bound (inclusive)
+        hi (int): Upper bound (exclusive, at most the store limit + 1)
+    
+    Yields:
+        int: Next prime in [lo, hi)
+    """
+    limit, bits, _ = store
+    if hi > limit + 1:
+        raise ValueError(f"hi = {hi} is beyond the store limit {limit}")
+    if lo <= 2 < hi:
+        yield 2
+    
+    first = max(lo, 3) // 2  # bit of the first odd number >= lo
+    last = (hi - 2) // 2  # bit of the last odd number < hi
+    if first > last:
+        return
+    
+    for offset in range(first // 8, last // 8 + 1, STORE_BLOCK_BYTES):
+        flags = _unpack_bits(bits[offset:min(offset + STORE_BLOCK_BYTES, last // 8 + 1)])
+        base = 8 * offset
+        lo_index = max(first - base, 0)
+        hi_index = min(last - base + 1, len(flags))
+        yield from compress(range(2 * (base + lo_index) + 1, 2 * (base + hi_index) + 1, 2),
+                            flags[lo_index:hi_index])
@@ -0,0 +1,186 @@
+"""
+Compact prime bitmap on the mod-30 wheel.
+
+Only the numbers 30k + r with r in WHEEL_RESIDUES (1, 7, 11, 13, 17, 19, 23,
+29) can be primes above 5, so one byte holds the primality of 30 integers:
+bit i of byte k stands for 30k + WHEEL_RESIDUES[i]. That is 30 times less
+than one byte per integer and about 240 times less than a list of bools;
+the primes up to 10^10 take 333 MB. The bytes come straight out of
+wheel_segment, one segment at a time. As in the prime store, the running
+prime count is kept every WHEEL_BLOCK_BYTES bytes, so rank (π(x)) and
+select (the k-th prime) only scan one block.
+"""
+
+import struct
+from array import array
+from math import isqrt
+
+from .core import is_prime
+from .counting import count_primes
+from .sieve import SEGMENT_SIZE, WHEEL_INDEX, WHEEL_RESIDUES, _small_primes, wheel_segment
+from .store import _POPCOUNT, _select_bit
+
+WHEEL_MAGIC = b"PRIMEW30"
+WHEEL_HEADER = struct.Struct("=8sQ")  # magic, limit
+WHEEL_BLOCK_BYTES = 4096  # wheel bytes (122880 integers) per rank checkpoint
+
+# Bits of a wheel byte whose residue is <= r, for r = 0 ... 29
+_RESIDUE_MASKS = bytes(
+    sum(1 << i for i, residue in enumerate(WHEEL_RESIDUES) if residue <= r) for r in range(30)
+)
+# Residues set in every byte value
+_BYTE_RESIDUES = [
+    tuple(residue for i, residue in enumerate(WHEEL_RESIDUES) if value >> i & 1) for value in range(256)
+]
+
+
+class WheelBitmap:
+    """
+    Primality of every integer up to a limit, 8 bits per 30 integers.
+    
+    Supports n in bitmap, len(bitmap) (the number of primes), iteration in
+    increasing order, rank and select, and a round trip through bytes.
+    
+    Args:
+        limit (int): Largest number covered (at least 0)
+        segment_size (int): Wheel bytes sieved per segment
+    """
+    
+    def __init__(self, limit, segment_size=SEGMENT_SIZE):
+        if limit < 0:
+            raise ValueError("limit must be at least 0")
+        
+        byte_count = limit // 30 + 1
+        base_primes = _small_primes(isqrt(30 * byte_count))[3:]  # 7, 11, ...
+        bits = bytearray()
+        for k_lo in range(0, byte_count, segment_size):
+            bits += wheel_segment(k_lo, min(k_lo + segment_size, byte_count), base_primes)
+        bits[-1] &= _RESIDUE_MASKS[limit % 30]  # nothing beyond limit
+        
+        self._set_bits(limit, bits)
+    
+    def _set_bits(self, limit, bits):
+        """
+        Store the wheel bytes and build the rank checkpoints.
+        
+        Args:
+            limit (int): Largest number covered
+            bits (bytes-like): limit // 30 + 1 wheel bytes
+        """
+        self.limit = limit
+        self.bits = bits
+        self.counts = array("Q", [0])  # counts[b]: primes > 5 before block b
+        total = 0
+        for start in range(0, len(bits), WHEEL_BLOCK_BYTES):
+            total += int.from_bytes(bits[start:start + WHEEL_BLOCK_BYTES], "little").bit_count()
+            self.counts.append(total)
+    
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Rebuild a bitmap written by to_bytes.
+        
+        Args:
+            data (bytes): Header and wheel bytes
+        
+        Returns:
+            WheelBitmap: The bitmap (no sieving is done)
+        """
+        magic, limit = WHEEL_HEADER.unpack_from(data)
+        if magic != WHEEL_MAGIC:
+            raise ValueError("data is not a wheel bitmap")
+        bits = bytes(data[WHEEL_HEADER.size:])
+        if len(bits) != limit // 30 + 1:
+            raise ValueError(f"expected {limit // 30 + 1} wheel bytes, got {len(bits)}")
+        
+        bitmap = cls.__new__(cls)
+        bitmap._set_bits(limit, bits)
+        return bitmap
+    
+    def to_bytes(self):
+        """
+        Serialize the bitmap: a 16-byte header (magic, limit) and the wheel bytes.
+        
+        Returns:
+            bytes: Serialized bitmap
+        """
+        return WHEEL_HEADER.pack(WHEEL_MAGIC, self.limit) + self.bits
+    
+    def __contains__(self, n):
+        """
+        Tell whether n is prime; n beyond the limit falls back to is_prime.
+        
+        Args:
+            n (int): Number to test
+        
+        Returns:
+            bool: True if n is prime
+        """
+        if n > self.limit:
+            return is_prime(n)
+        if n < 7:
+            return n in (2, 3, 5)
+        k, r = divmod(n, 30)
+        bit = WHEEL_INDEX.get(r)
+        return bit is not None and self.bits[k] >> bit & 1 == 1
+    
+    def __len__(self):
+        """Number of primes <= limit."""
+        return self.rank(self.limit)
+    
+    def __iter__(self):
+        """Yield the primes <= limit in increasing order."""
+        yield from (p for p in (2, 3, 5) if p <= self.limit)
+        for start in range(0, len(self.bits), WHEEL_BLOCK_BYTES):
+            block = self.bits[start:start + WHEEL_BLOCK_BYTES]
+            for k, value in enumerate(block, start):
+                if value:
+                    base = 30 * k
+                    for r in _BYTE_RESIDUES[value]:
+                        yield base + r
+    
+    def rank(self, x):
+        """
+        Count the primes <= x (the prime-counting function π(x)).
+        
+        Beyond the limit the count comes from count_primes.
+        
+        Args:
+            x (int): Upper bound
+        
+        Returns:
+            int: Number of primes p <= x
+        """
+        if x > self.limit:
+            return count_primes(x)
+        if x < 7:
+            return sum(1 for p in (2, 3, 5) if p <= x)
+        
+        k, r = divmod(x, 30)
+        block_start = k - k % WHEEL_BLOCK_BYTES
+        count = self.counts[block_start // WHEEL_BLOCK_BYTES]
+        count += int.from_bytes(self.bits[block_start:k], "little").bit_count()
+        count += _POPCOUNT[self.bits[k] & _RESIDUE_MASKS[r]]
+        return count + 3  # 2, 3 and 5
+    
+    def select(self, k):
+        """
+        Find the k-th prime (select(1) == 2).
+        
+        Args:
+            k (int): Index of the prime, from 1 to len(self)
+        
+        Returns:
+            int: The k-th prime
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if k > len(self):
+            raise ValueError(f"the bitmap only holds {len(self)} primes")
+        if k <= 3:
+            return (2, 3, 5)[k - 1]
+        
+        target = k - 3  # rank among the primes above 5
+        position, residue = _select_bit(self.bits, self.counts, WHEEL_BLOCK_BYTES, target,
+                                        _BYTE_RESIDUES)
+        return 30 * position + residue